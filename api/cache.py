@@ -0,0 +1,135 @@
+"""In-process TTL cache and HTTP cache validation for read-heavy API endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.database import data_version, today
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after insert."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def ttl_cache(seconds: float = 30, maxsize: int = 256) -> Callable[[F], F]:
+    """Cache an endpoint's return value per argument set for ``seconds``.
+
+    Every request is keyed on its query parameters, the data version and
+    the date (like the ETag), so identical feeds are served from memory until
+    the entry expires, the day rolls over or the database is swapped. Nothing is
+    cached while no database is open. Exceptions (e.g. 404s) are never
+    cached. Returned objects are shared between requests and must not be
+    mutated by callers.
+    """
+
+    def decorator(func: F) -> F:
+        cache = _TTLCache(seconds, maxsize)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            version = data_version()
+            if version is None:
+                return func(*args, **kwargs)
+            key = (version, today(), args, tuple(sorted(kwargs.items())))
+            hit, value = cache.get(key)
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            cache.set(key, value)
+            return value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class ETagMiddleware:
+    """Answer conditional GETs under ``/api`` with 304 Not Modified.
+
+    The ETag hashes the data version, today's date (feeds are relative to
+    it) and the request URL, so a match is decided before any database
+    work or serialization happens.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 60, stale: int = 300) -> None:
+        self.app = app
+        self.cache_control = (
+            f"public, max-age={max_age}, stale-while-revalidate={stale}".encode()
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        version = data_version()
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not scope["path"].startswith("/api/")
+            or scope["path"] == "/api/health"
+            or version is None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = f"{version}:{today()}:{scope['path']}?{scope['query_string'].decode()}"
+        etag = f'"{hashlib.blake2s(key.encode(), digest_size=8).hexdigest()}"'.encode()
+
+        headers = dict(scope["headers"])
+        if_none_match = headers.get(b"if-none-match", b"")
+        if etag in (t.strip().removeprefix(b"W/") for t in if_none_match.split(b",")):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [(b"etag", etag), (b"cache-control", self.cache_control)],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"etag", etag),
+                    (b"cache-control", self.cache_control),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -2,38 +2,230 @@
 
 from __future__ import annotations
 
-import duckdb
+import logging
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from datetime import date, datetime, timezone
+from typing import Any, Generator, Sequence
+
+import duckdb
 
-from config import DB_PATH
+from config import API_DB_MEMORY_LIMIT, API_DB_THREADS, DB_PATH
 
+__all__ = [
+    "get_db", "get_connection", "close_connection", "data_version", "today",
+    "has_table", "has_search_index", "escape_like", "bind_filters", "fetch_dicts",
+    "PASSAGE_VOTE_FILTER",
+]
+
+logger = logging.getLogger(__name__)
 
 _conn: duckdb.DuckDBPyConnection | None = None
+_conn_lock = threading.Lock()
+_search_index = False
+_tables: frozenset[str] = frozenset()
+_data_version: str | None = None
+
+# Fixed shapes of the activity feed's event streams. They live in an
+# in-memory catalog because the database file is opened read-only; the
+# router only adds WHERE clauses on top of their union.
+_API_VIEWS_SQL = """
+ATTACH ':memory:' AS api (READ_WRITE);
+
+CREATE VIEW api.activity_votes_v AS
+SELECT 'vote' AS event_type, v.vote_date AS date,
+       coalesce(b.title, v.question, 'Roll Call Vote') AS title,
+       v.result AS description,
+       v.bill_id, v.vote_id, v.chamber, b.policy_area, v.result,
+       v.chamber AS chamber_key, NULL AS sponsor_id
+FROM votes v
+LEFT JOIN bills b ON v.bill_id = b.bill_id;
+
+CREATE VIEW api.activity_bills_intro_v AS
+SELECT 'introduced' AS event_type, b.introduced_date AS date,
+       b.title, b.policy_area AS description,
+       b.bill_id, NULL AS vote_id, b.origin_chamber AS chamber,
+       b.policy_area, NULL AS result,
+       lower(b.origin_chamber) AS chamber_key, b.sponsor_id
+FROM bills b;
+
+CREATE VIEW api.activity_bills_enacted_v AS
+SELECT 'enacted' AS event_type, b.latest_action_date AS date,
+       b.title, 'Signed into law' AS description,
+       b.bill_id, NULL AS vote_id, b.origin_chamber AS chamber,
+       b.policy_area, NULL AS result,
+       lower(b.origin_chamber) AS chamber_key, b.sponsor_id
+FROM bills b
+WHERE b.status = 'enacted';
+"""
 
 
 def get_connection() -> duckdb.DuckDBPyConnection:
     """Get a shared read-only database connection (singleton)."""
-    global _conn
+    global _conn, _data_version
     if _conn is None:
-        _conn = duckdb.connect(str(DB_PATH), read_only=True)
+        with _conn_lock:
+            if _conn is None:
+                _conn = duckdb.connect(
+                    str(DB_PATH),
+                    read_only=True,
+                    config={
+                        "threads": API_DB_THREADS,
+                        "memory_limit": API_DB_MEMORY_LIMIT,
+                        "enable_object_cache": True,
+                        # Use ART indexes for point lookups only. Date-range
+                        # filters matching a few thousand rows are far cheaper
+                        # as zone-map-pruned scans than as index row fetches.
+                        "index_scan_max_count": 64,
+                        # Push page-sized join key sets (up to limit + 1 rows)
+                        # into the probe-side scan, so late-materialized pages
+                        # fetch their wide columns without a full hash join
+                        "dynamic_or_filter_threshold": 256,
+                    },
+                )
+                _create_views(_conn)
+                _load_search_index(_conn)
+                _probe_tables(_conn)
+                # Ingest needs the write lock, so the data can only change
+                # between opens; the file's mtime identifies what we serve
+                _data_version = format(DB_PATH.stat().st_mtime_ns, "x")
     return _conn
 
 
+def close_connection() -> None:
+    """Close the shared connection; the next get_connection() reopens it."""
+    global _conn, _data_version
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+            _data_version = None
+
+
+def _create_views(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create the API's helper views; endpoints that need them 503 if this fails."""
+    try:
+        conn.execute(_API_VIEWS_SQL)
+    except duckdb.Error:
+        logger.exception("Failed to create API views")
+
+
+def _probe_tables(conn: duckdb.DuckDBPyConnection) -> None:
+    """Record which tables and views exist; dbt marts may not be built yet."""
+    global _tables
+    rows = conn.execute(
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_catalog = current_database()"
+    ).fetchall()
+    _tables = frozenset(r[0] for r in rows)
+
+
+def _load_search_index(conn: duckdb.DuckDBPyConnection) -> None:
+    """Load the FTS extension if `sync search-index` has built a current index.
+
+    The index is a snapshot, so it is only used when no bill, cosponsor or
+    subject sync has run since it was built; otherwise bills added since
+    would be missing from results whenever the old index matched anything.
+    """
+    global _search_index
+    _search_index = False
+    try:
+        conn.execute("LOAD fts")
+        conn.execute("SELECT 1 FROM fts_main_bill_search.docs LIMIT 1")
+        stale = conn.execute(_SEARCH_INDEX_STALE_SQL).fetchone()[0]
+    except duckdb.Error:
+        logger.info("Bill search index not available; using substring search")
+        return
+    if stale:
+        logger.warning("Bill search index predates the last bill sync; using substring search")
+        return
+    _search_index = True
+
+
+# True unless the index build recorded in sync_meta is newer than every
+# bills/cosponsors/subjects sync and bill write it was built from
+_SEARCH_INDEX_STALE_SQL = """
+    SELECT coalesce(
+        (SELECT last_sync_at FROM sync_meta WHERE entity = 'search-index')
+            < greatest(
+                (SELECT max(last_sync_at) FROM sync_meta
+                 WHERE entity LIKE 'bills-%'
+                    OR entity LIKE 'cosponsors-%'
+                    OR entity LIKE 'subjects-%'),
+                (SELECT max(updated_at) FROM bills)
+            ),
+        TRUE
+    )
+"""
+
+
+def data_version() -> str | None:
+    """Version of the data being served, or None before the database is open."""
+    return _data_version
+
+
+def today() -> date:
+    """The (UTC) date that date-relative queries, caches and ETags use.
+
+    Queries bind this instead of DuckDB's current_date, whose time zone can
+    differ from the process's, so a feed body and its ETag always agree.
+    """
+    return datetime.now(timezone.utc).date()
+
+
+def has_table(name: str) -> bool:
+    """Whether a table or view exists in the served database."""
+    get_connection()
+    return name in _tables
+
+
+def has_search_index() -> bool:
+    """Whether bill search can use the full-text index."""
+    get_connection()
+    return _search_index
+
+
 @contextmanager
 def get_db() -> Generator[duckdb.DuckDBPyConnection, None, None]:
-    """Context manager for the shared database connection."""
-    yield get_connection()
+    """Yield a per-request cursor on the shared connection.
+
+    Cursors share the catalog and buffer pool but execute independently,
+    so concurrent requests are not serialized on one connection.
+    """
+    cur = get_connection().cursor()
+    try:
+        yield cur
+    finally:
+        cur.close()
 
 
 def escape_like(value: str) -> str:
-    """Escape special ILIKE characters (%, _, \\) in user input."""
+    """Escape special LIKE characters (%, _, \\) in user input."""
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
-PASSAGE_VOTE_FILTER = (
-    "(question ILIKE '%passage%' OR question ILIKE '%pass%' "
-    "OR question ILIKE '%conference report%' OR question ILIKE '%override%' "
-    "OR question ILIKE '%concur%' OR question ILIKE '%adopt%' "
-    "OR question ILIKE '%ratif%')"
-)
+def bind_filters(params: dict[str, Any]) -> dict[str, Any]:
+    """Drop unset filters; DuckDB rejects unused named parameters.
+
+    The remaining keys also identify the filter combination, so routers
+    pass ``tuple(...)`` of the result to their cached SQL builders.
+    """
+    return {k: v for k, v in params.items() if v}
+
+
+def fetch_dicts(
+    cur: duckdb.DuckDBPyConnection, fields: Sequence[str], batch_size: int = 1000,
+) -> list[dict[str, Any]]:
+    """Drain an executed cursor into dicts keyed positionally by ``fields``.
+
+    Rows are pulled in batches so the raw tuples and the dicts built from
+    them are never both held in full.
+    """
+    items: list[dict[str, Any]] = []
+    while batch := cur.fetchmany(batch_size):
+        items.extend(dict(zip(fields, r)) for r in batch)
+    return items
+
+
+# Passage-type votes are classified once at ingest (see ingestion.constants)
+PASSAGE_VOTE_FILTER = "is_passage_vote"
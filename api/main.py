@@ -1,16 +1,44 @@
 """FastAPI application for Distillgov."""
 
+import logging
+from contextlib import asynccontextmanager
+
+import duckdb
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.cache import ETagMiddleware
+from api.database import close_connection, get_connection
 from api.routers import activity, members, bills, committees, votes, stats
+from config import API_WORKER_THREADS
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints run on AnyIO's worker pool (40 threads by default)
+    to_thread.current_default_thread_limiter().total_tokens = API_WORKER_THREADS
+    # Open the shared connection (views, search index) before serving, so
+    # the first request doesn't pay for it
+    try:
+        get_connection()
+    except duckdb.Error:
+        logger.warning("Database not available at startup; will retry on first request")
+    yield
+    close_connection()
+
 
 app = FastAPI(
     title="Distillgov API",
     description="Congress, distilled. Access congressional data in a simple, accessible way.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+app.add_middleware(ETagMiddleware)
+
 # CORS for frontend
 app.add_middleware(
     CORSMiddleware,
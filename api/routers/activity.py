@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 
+import duckdb
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from api.database import escape_like, get_db
+from api.cache import ttl_cache
+from api.database import escape_like, get_db, has_table, today
 
 router = APIRouter()
 
@@ -29,20 +32,47 @@ class ActivityItem(BaseModel):
     result: str | None = None
 
 
+class ActivityItemLite(BaseModel):
+    event_type: str
+    date: date | None
+    bill_id: str | None = None
+    vote_id: str | None = None
+
+
 class ActivityFeed(BaseModel):
     items: list[ActivityItem]
-    total: int
+    total: int | None = None
+    offset: int
+    limit: int
+    has_more: bool = False
+    next_cursor: date | None = None
+
+
+class ActivityFeedLite(BaseModel):
+    items: list[ActivityItemLite]
+    total: int | None = None
     offset: int
     limit: int
+    has_more: bool = False
     next_cursor: date | None = None
 
 
+class ActivityCount(BaseModel):
+    total: int
+
+
+class TrendingSubject(BaseModel):
+    subject: str
+    bill_count: int
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 
 
-@router.get("/recent", response_model=ActivityFeed)
+@router.get("/recent", response_model=ActivityFeed | ActivityFeedLite)
+@ttl_cache(seconds=30)
 def recent_activity(
     subject: str | None = Query(None, description="Filter by legislative subject"),
     policy_area: str | None = Query(None, description="Filter by policy area"),
@@ -53,235 +83,80 @@ def recent_activity(
     before: date | None = Query(None, description="Cursor: only show events before this date (preferred over offset)"),
     limit: int = Query(50, ge=1, le=250),
     offset: int = Query(0, ge=0),
+    projection: str = Query("full", description="Item fields: full, or ids (event_type, date, bill_id, vote_id)"),
 ):
     """What's happening in Congress right now.
 
     Returns a unified, chronological feed of recent votes, bill introductions,
     and enactments. Filter by topic, member, or zip code to see what matters to you.
+    Page with `next_cursor` while `has_more` is true; use `/activity/count` when
+    an exact total is needed. `projection=ids` returns only the identifying
+    fields of each event, for timelines that fetch details separately.
 
     Event types:
     - **vote**: A roll call vote was held (passage, amendment, procedural)
     - **introduced**: A new bill was introduced
     - **enacted**: A bill became law
     """
+    if projection not in ("full", "ids"):
+        raise HTTPException(status_code=400, detail="projection must be one of: full, ids")
+    ids_only = projection == "ids"
+
+    params, shape = _feed_params(subject, policy_area, member, zip_code, chamber, days, before)
+    # One extra row tells us whether another page exists without counting
+    params["limit"] = limit + 1
+    if not before:
+        params["offset"] = offset
+
+    with get_db() as conn:
+        rows = _execute_feed(conn, _build_activity_sql(*shape, ids_only), params, zip_code)
+
+        # An empty feed is the only case where the zip may have matched nobody
+        if not rows and zip_code:
+            _assert_zip_has_reps(conn, zip_code)
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # Rows map positionally onto the item model; the whole page is then
+        # validated in a single pass instead of one model call per row
+        feed_model, fields = (ActivityFeedLite, _LITE_FIELDS) if ids_only else (ActivityFeed, _ITEM_FIELDS)
+        return feed_model.model_validate({
+            "items": [dict(zip(fields, r)) for r in rows],
+            "offset": offset,
+            "limit": limit,
+            "has_more": has_more,
+            # Derive next_cursor from the last item's date
+            "next_cursor": rows[-1][1] if rows else None,
+        })
+
+
+@router.get("/count", response_model=ActivityCount)
+@ttl_cache(seconds=30)
+def activity_count(
+    subject: str | None = Query(None, description="Filter by legislative subject"),
+    policy_area: str | None = Query(None, description="Filter by policy area"),
+    member: str | None = Query(None, description="Filter by member bioguide_id (their votes and sponsored bills)"),
+    zip_code: str | None = Query(None, description="Filter by zip code (activity from your reps)"),
+    chamber: str | None = Query(None, description="Filter by chamber: house, senate"),
+    days: int = Query(30, ge=1, le=365, description="Look back this many days"),
+    before: date | None = Query(None, description="Only count events before this date"),
+):
+    """Total number of events matching the same filters as `/activity/recent`."""
+    params, shape = _feed_params(subject, policy_area, member, zip_code, chamber, days, before)
+
     with get_db() as conn:
-        # If zip_code provided, resolve to member IDs
-        member_ids: list[str] = []
-        if zip_code:
-            if len(zip_code) != 5 or not zip_code.isdigit():
-                raise HTTPException(status_code=400, detail="Zip code must be 5 digits")
-            try:
-                rows = conn.execute(
-                    """
-                    SELECT DISTINCT m.bioguide_id
-                    FROM zip_districts z
-                    JOIN members m ON z.state = m.state AND z.district = m.district AND m.chamber = 'house'
-                    WHERE z.zcta = ? AND m.is_current = TRUE
-                    UNION
-                    SELECT m.bioguide_id
-                    FROM members m
-                    WHERE m.state = (SELECT z.state FROM zip_districts z WHERE z.zcta = ? LIMIT 1)
-                      AND m.chamber = 'senate' AND m.is_current = TRUE
-                    """,
-                    [zip_code, zip_code],
-                ).fetchall()
-            except Exception:
-                raise HTTPException(
-                    status_code=503,
-                    detail="Zip code lookup is not available. Run 'python -m ingestion.cli sync load-zips' to load zip code data.",
-                )
-            member_ids = [r[0] for r in rows]
-            if not member_ids:
-                raise HTTPException(status_code=404, detail="No representatives found for this zip code")
-        elif member:
-            member_ids = [member]
-
-        # Build the subject filter join
-        subject_join = ""
-        subject_condition = ""
-        subject_params: list[object] = []
-        if subject:
-            subject_join = "JOIN bill_subjects bs ON b.bill_id = bs.bill_id"
-            subject_condition = "AND bs.subject ILIKE ? ESCAPE '\\'"
-            subject_params = [f"%{escape_like(subject)}%"]
-
-        policy_condition = ""
-        policy_params: list[object] = []
-        if policy_area:
-            policy_condition = "AND b.policy_area = ?"
-            policy_params = [policy_area]
-
-        chamber_condition = ""
-        chamber_params: list[object] = []
-        if chamber:
-            chamber_condition = "AND chamber = ?"
-            chamber_params = [chamber.lower()]
-
-        # Member filter for votes
-        member_vote_condition = ""
-        member_vote_params: list[object] = []
-        if member_ids:
-            placeholders = ", ".join(["?"] * len(member_ids))
-            member_vote_condition = f"AND v.vote_id IN (SELECT vote_id FROM member_votes WHERE bioguide_id IN ({placeholders}))"
-            member_vote_params = list(member_ids)
-
-        # Member filter for bills
-        member_bill_condition = ""
-        member_bill_params: list[object] = []
-        if member_ids:
-            placeholders = ", ".join(["?"] * len(member_ids))
-            member_bill_condition = f"AND (b.sponsor_id IN ({placeholders}) OR b.bill_id IN (SELECT bill_id FROM bill_cosponsors WHERE bioguide_id IN ({placeholders})))"
-            member_bill_params = list(member_ids) + list(member_ids)
-
-        # Keyset cursor filter
-        cursor_vote_condition = ""
-        cursor_vote_params: list[object] = []
-        cursor_intro_condition = ""
-        cursor_intro_params: list[object] = []
-        cursor_enacted_condition = ""
-        cursor_enacted_params: list[object] = []
-        if before:
-            cursor_vote_condition = "AND v.vote_date < ?"
-            cursor_vote_params = [before]
-            cursor_intro_condition = "AND b.introduced_date < ?"
-            cursor_intro_params = [before]
-            cursor_enacted_condition = "AND b.latest_action_date < ?"
-            cursor_enacted_params = [before]
-
-        # Votes feed
-        votes_query = f"""
-            SELECT 'vote' as event_type, v.vote_date as date,
-                   coalesce(b.title, v.question, 'Roll Call Vote') as title,
-                   v.result as description,
-                   v.bill_id, v.vote_id, v.chamber, b.policy_area, v.result
-            FROM votes v
-            LEFT JOIN bills b ON v.bill_id = b.bill_id
-            {subject_join}
-            WHERE v.vote_date >= current_date - interval '{days} days'
-            {cursor_vote_condition}
-            {subject_condition}
-            {policy_condition}
-            {chamber_condition.replace("chamber", "v.chamber")}
-            {member_vote_condition}
-        """
-
-        # Bills introduced feed
-        bills_intro_query = f"""
-            SELECT 'introduced' as event_type, b.introduced_date as date,
-                   b.title, b.policy_area as description,
-                   b.bill_id, NULL as vote_id, b.origin_chamber as chamber,
-                   b.policy_area, NULL as result
-            FROM bills b
-            {subject_join}
-            WHERE b.introduced_date >= current_date - interval '{days} days'
-            {cursor_intro_condition}
-            {subject_condition}
-            {policy_condition}
-            {chamber_condition.replace("chamber", "b.origin_chamber") if chamber else ""}
-            {member_bill_condition}
-        """
-
-        # Bills enacted feed
-        enacted_query = f"""
-            SELECT 'enacted' as event_type, b.latest_action_date as date,
-                   b.title, 'Signed into law' as description,
-                   b.bill_id, NULL as vote_id, b.origin_chamber as chamber,
-                   b.policy_area, NULL as result
-            FROM bills b
-            {subject_join}
-            WHERE b.status = 'enacted'
-              AND b.latest_action_date >= current_date - interval '{days} days'
-            {cursor_enacted_condition}
-            {subject_condition}
-            {policy_condition}
-            {member_bill_condition}
-        """
-
-        # Combine all params in order
-        votes_params: list[object] = []
-        votes_params.extend(cursor_vote_params)
-        if subject:
-            votes_params.extend(subject_params)
-        if policy_area:
-            votes_params.extend(policy_params)
-        if chamber:
-            votes_params.extend(chamber_params)
-        votes_params.extend(member_vote_params)
-
-        intro_params: list[object] = []
-        intro_params.extend(cursor_intro_params)
-        if subject:
-            intro_params.extend(subject_params)
-        if policy_area:
-            intro_params.extend(policy_params)
-        if chamber:
-            intro_params.extend(chamber_params)
-        intro_params.extend(member_bill_params)
-
-        enacted_params: list[object] = []
-        enacted_params.extend(cursor_enacted_params)
-        if subject:
-            enacted_params.extend(subject_params)
-        if policy_area:
-            enacted_params.extend(policy_params)
-        enacted_params.extend(member_bill_params)
-
-        # When using keyset cursor, omit OFFSET
-        use_offset = not before
-        offset_clause = "OFFSET ?" if use_offset else ""
-
-        combined_query = f"""
-            SELECT * FROM (
-                {votes_query}
-                UNION ALL
-                {bills_intro_query}
-                UNION ALL
-                {enacted_query}
-            )
-            ORDER BY date DESC NULLS LAST
-            LIMIT ? {offset_clause}
-        """
-
-        pagination_params: list[object] = [limit]
-        if use_offset:
-            pagination_params.append(offset)
-
-        all_params = votes_params + intro_params + enacted_params + pagination_params
-
-        rows = conn.execute(combined_query, all_params).fetchall()
-
-        # Count total
-        count_query = f"""
-            SELECT count(*) FROM (
-                {votes_query}
-                UNION ALL
-                {bills_intro_query}
-                UNION ALL
-                {enacted_query}
-            )
-        """
-        count_params = votes_params + intro_params + enacted_params
-        total = conn.execute(count_query, count_params).fetchone()[0]
-
-        items = [
-            ActivityItem(
-                event_type=r[0], date=r[1], title=r[2] or "Untitled",
-                description=r[3], bill_id=r[4], vote_id=r[5],
-                chamber=r[6], policy_area=r[7], result=r[8],
-            )
-            for r in rows
-        ]
-
-        # Derive next_cursor from the last item's date
-        next_cursor = items[-1].date if items else None
-
-        return ActivityFeed(
-            items=items, total=total, offset=offset, limit=limit,
-            next_cursor=next_cursor,
+        rows = _execute_feed(
+            conn, f"SELECT count(*) FROM ({_build_feed_sql(*shape)})", params, zip_code
         )
+        total = rows[0][0]
+        if not total and zip_code:
+            _assert_zip_has_reps(conn, zip_code)
+        return ActivityCount(total=total)
 
 
-@router.get("/trending-subjects", response_model=list[dict])
+@router.get("/trending-subjects", response_model=list[TrendingSubject])
+@ttl_cache(seconds=60)
 def trending_subjects(
     days: int = Query(30, ge=1, le=365, description="Look back this many days"),
     limit: int = Query(20, ge=1, le=100),
@@ -292,19 +167,218 @@ def trending_subjects(
     in the given timeframe. Use these to understand what Congress is focused on.
     """
     with get_db() as conn:
+        # Common windows are precomputed by dbt (agg_trending_subjects)
+        if days in _TRENDING_WINDOWS and has_table("agg_trending_subjects"):
+            rows = conn.execute(
+                """
+                SELECT subject, bill_count
+                FROM agg_trending_subjects
+                WHERE days = ? AND snapshot_date = ?
+                ORDER BY bill_count DESC, subject
+                LIMIT ?
+                """,
+                [days, today(), limit],
+            ).fetchall()
+            if rows:
+                return [{"subject": r[0], "bill_count": r[1]} for r in rows]
+
         try:
             rows = conn.execute(
                 """
                 SELECT bs.subject, count(DISTINCT bs.bill_id) as bill_count
                 FROM bill_subjects bs
                 JOIN bills b ON bs.bill_id = b.bill_id
-                WHERE b.latest_action_date >= current_date - interval ? day
+                WHERE b.latest_action_date >= ? - CAST(? AS INTEGER) * INTERVAL 1 DAY
                 GROUP BY bs.subject
-                ORDER BY bill_count DESC
+                ORDER BY bill_count DESC, bs.subject
                 LIMIT ?
                 """,
-                [days, limit],
+                [today(), days, limit],
             ).fetchall()
             return [{"subject": r[0], "bill_count": r[1]} for r in rows]
         except Exception:
             return []
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _feed_params(
+    subject: str | None,
+    policy_area: str | None,
+    member: str | None,
+    zip_code: str | None,
+    chamber: str | None,
+    days: int,
+    before: date | None,
+) -> tuple[dict[str, object], tuple]:
+    """Bind the feed filters by name and describe which ones are present.
+
+    Every filter binds by name, so each value is supplied exactly once no
+    matter how many UNION arms reference it. The returned shape tuple keys
+    the cached SQL builders.
+    """
+    if zip_code and (len(zip_code) != 5 or not zip_code.isdigit()):
+        raise HTTPException(status_code=400, detail="Zip code must be 5 digits")
+
+    params: dict[str, object] = {"days": days, "today": today()}
+    if subject:
+        params["subject"] = f"%{escape_like(subject.lower())}%"
+    if policy_area:
+        params["policy_area"] = policy_area
+    if chamber:
+        params["chamber"] = chamber.lower()
+    # A zip code is resolved to its representatives inside the query
+    reps_source: str | None = None
+    if zip_code:
+        reps_source = "zip"
+        params["zip_code"] = zip_code
+    elif member:
+        reps_source = "member"
+        params["member"] = member
+    if before:
+        params["before"] = before
+
+    shape = (bool(subject), bool(policy_area), bool(chamber), reps_source, bool(before))
+    return params, shape
+
+
+def _execute_feed(
+    conn: duckdb.DuckDBPyConnection,
+    sql: str,
+    params: dict[str, object],
+    zip_code: str | None,
+) -> list[tuple]:
+    """Run a feed query, mapping a missing zip table to a 503 with a fix hint."""
+    try:
+        return conn.execute(sql, params).fetchall()
+    except duckdb.CatalogException:
+        if not zip_code:
+            raise
+        raise HTTPException(
+            status_code=503,
+            detail="Zip code lookup is not available. Run 'python -m ingestion.cli sync load-zips' to load zip code data.",
+        )
+
+
+def _assert_zip_has_reps(conn: duckdb.DuckDBPyConnection, zip_code: str) -> None:
+    """Raise 404 if the zip code resolves to no current representatives."""
+    reps = conn.execute(
+        f"SELECT count(*) FROM ({_ZIP_REPS_SQL})", {"zip_code": zip_code}
+    ).fetchone()[0]
+    if not reps:
+        raise HTTPException(status_code=404, detail="No representatives found for this zip code")
+
+
+# Column order of the feed query's SELECT list, per projection
+_ITEM_FIELDS = tuple(ActivityItem.model_fields)
+_LITE_FIELDS = tuple(ActivityItemLite.model_fields)
+
+# Look-back windows precomputed in agg_trending_subjects
+_TRENDING_WINDOWS = {7, 30, 90, 365}
+
+
+# Current House member for the zip's district plus the state's senators
+_ZIP_REPS_SQL = """
+    SELECT DISTINCT m.bioguide_id
+    FROM zip_districts z
+    JOIN members m ON z.state = m.state AND z.district = m.district AND m.chamber = 'house'
+    WHERE z.zcta = $zip_code AND m.is_current = TRUE
+    UNION
+    SELECT m.bioguide_id
+    FROM members m
+    WHERE m.state = (SELECT z.state FROM zip_districts z WHERE z.zcta = $zip_code LIMIT 1)
+      AND m.chamber = 'senate' AND m.is_current = TRUE
+"""
+
+
+@lru_cache(maxsize=64)
+def _build_feed_sql(
+    has_subject: bool,
+    has_policy: bool,
+    has_chamber: bool,
+    reps_source: str | None,
+    has_before: bool,
+    ids_only: bool = False,
+) -> str:
+    """Build the activity feed query for one combination of filters.
+
+    The three event streams are fixed views (see api.database), so only the
+    outer WHERE clause varies. Values are bound as named parameters, and
+    the text is cached per filter shape.
+    """
+    # Predicates are emitted cheapest-first: equalities, then the member
+    # semi-join, then date ranges, with the subject LIKE last.
+    conditions: list[str] = []
+    if has_policy:
+        conditions.append("policy_area = $policy_area")
+    if has_chamber:
+        conditions.append("chamber_key = $chamber")
+
+    # Member filters read from a reps CTE: the zip code's delegation or a
+    # single bioguide_id
+    reps_cte = ""
+    if reps_source:
+        reps_query = _ZIP_REPS_SQL if reps_source == "zip" else "SELECT $member AS bioguide_id"
+        reps_cte = f"WITH reps AS ({reps_query})"
+        conditions.append(
+            "((event_type = 'vote' AND vote_id IN ("
+            "SELECT vote_id FROM member_votes WHERE bioguide_id IN (SELECT bioguide_id FROM reps)))"
+            " OR (event_type <> 'vote' AND (sponsor_id IN (SELECT bioguide_id FROM reps)"
+            " OR bill_id IN (SELECT bill_id FROM bill_cosponsors"
+            " WHERE bioguide_id IN (SELECT bioguide_id FROM reps)))))"
+        )
+
+    if has_before:
+        conditions.append("date < $before")
+    conditions.append("date >= $today - CAST($days AS INTEGER) * INTERVAL 1 DAY")
+
+    if has_subject:
+        conditions.append(
+            "bill_id IN (SELECT bill_id FROM bill_subjects WHERE subject_lower LIKE $subject ESCAPE '\\')"
+        )
+
+    if ids_only:
+        columns = "event_type, date, bill_id, vote_id"
+    else:
+        columns = """event_type, date, coalesce(title, 'Untitled') AS title,
+               description, bill_id, vote_id, chamber, policy_area, result"""
+
+    return f"""
+        {reps_cte}
+        SELECT {columns}
+        FROM (
+            SELECT * FROM api.activity_votes_v
+            UNION ALL
+            SELECT * FROM api.activity_bills_intro_v
+            UNION ALL
+            SELECT * FROM api.activity_bills_enacted_v
+        )
+        WHERE {" AND ".join(conditions)}
+    """
+
+
+@lru_cache(maxsize=64)
+def _build_activity_sql(
+    has_subject: bool,
+    has_policy: bool,
+    has_chamber: bool,
+    reps_source: str | None,
+    has_before: bool,
+    ids_only: bool = False,
+) -> str:
+    """Build the paged activity query for one combination of filters."""
+    feed_query = _build_feed_sql(
+        has_subject, has_policy, has_chamber, reps_source, has_before, ids_only
+    )
+
+    # When using keyset cursor, omit OFFSET
+    offset_clause = "" if has_before else "OFFSET $offset"
+
+    return f"""
+        SELECT * FROM ({feed_query})
+        ORDER BY date DESC NULLS LAST
+        LIMIT $limit {offset_clause}
+    """
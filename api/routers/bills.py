@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import base64
 from datetime import date
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from api.database import escape_like, get_db
+from api.cache import ttl_cache
+from api.database import bind_filters, escape_like, fetch_dicts, get_db, has_search_index
 
 router = APIRouter()
 
@@ -47,9 +50,10 @@ class BillDetail(Bill):
 
 class BillList(BaseModel):
     bills: list[Bill]
-    total: int
+    total: int | None = None
     offset: int
     limit: int
+    next_cursor: str | None = None
 
 
 class Subject(BaseModel):
@@ -59,7 +63,7 @@ class Subject(BaseModel):
 
 class SubjectList(BaseModel):
     subjects: list[Subject]
-    total: int
+    total: int | None = None
 
 
 class Category(BaseModel):
@@ -104,6 +108,7 @@ class BillVoteList(BaseModel):
 
 
 @router.get("/categories", response_model=CategoryList)
+@ttl_cache(seconds=300)
 def list_categories():
     """List all bill policy areas with counts.
 
@@ -126,44 +131,38 @@ def list_categories():
 
 
 @router.get("/subjects", response_model=SubjectList)
+@ttl_cache(seconds=300)
 def list_subjects(
     q: str | None = Query(None, description="Search subjects by keyword"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    include_total: bool = Query(False, description="Also count all matches (costs an extra scan)"),
 ):
     """Browse all legislative subject tags with bill counts.
 
     Subjects are more granular than policy areas — a single bill can have
     dozens of subjects. Use these with the `subject` filter on the activity feed
-    or member voting record.
+    or member voting record. `total` is null unless `include_total` is set.
     """
-    with get_db() as conn:
-        conditions = []
-        params: list[object] = []
-
-        if q:
-            conditions.append("bs.subject ILIKE ? ESCAPE '\\'")
-            params.append(f"%{escape_like(q)}%")
-
-        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-        total = conn.execute(
-            f"SELECT count(DISTINCT subject) FROM bill_subjects bs {where}",
-            params,
-        ).fetchone()[0]
+    params = {"pattern": f"%{escape_like(q.lower())}%"} if q else {}
+    page_sql, count_sql = _build_subjects_sql(bool(q), include_total)
 
+    with get_db() as conn:
         rows = conn.execute(
-            f"""
-            SELECT bs.subject, count(*) as bill_count
-            FROM bill_subjects bs
-            {where}
-            GROUP BY bs.subject
-            ORDER BY bill_count DESC
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+            page_sql, {**params, "limit": limit, "offset": offset}
         ).fetchall()
 
+        # The window total rides along on every row; an empty page past the
+        # end still needs its own count
+        if not include_total:
+            total = None
+        elif rows:
+            total = rows[0][2]
+        elif offset:
+            total = conn.execute(count_sql, params).fetchone()[0]
+        else:
+            total = 0
+
         return SubjectList(
             subjects=[Subject(name=r[0], bill_count=r[1]) for r in rows],
             total=total,
@@ -180,134 +179,125 @@ def list_bills(
     policy_area: str | None = Query(None, description="Filter by policy area / category"),
     sponsor_id: str | None = Query(None, description="Filter by sponsor bioguide_id"),
     chamber: str | None = Query(None, description="Filter by origin chamber: house, senate"),
+    cursor: str | None = Query(None, description="Resume after a previous page's next_cursor (preferred over offset)"),
     limit: int = Query(50, ge=1, le=250),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Deprecated: use cursor"),
+    include_total: bool = Query(False, description="Also count all matches (costs an extra scan)"),
 ):
     """List bills with filtering and search.
 
     Use `q` to search bill titles and subjects. Use `subject` for exact subject match.
     Use `/api/bills/subjects` to browse available subjects.
     Use `/api/bills/categories` to get valid `policy_area` values.
+    Page by passing `next_cursor` back as `cursor`; it is null on the last page.
+    `total` is null unless `include_total` is set.
     """
+    filter_params = bind_filters({
+        "subject": subject,
+        "congress": congress,
+        "status": status,
+        "bill_type": bill_type.lower() if bill_type else None,
+        "policy_area": policy_area,
+        "sponsor_id": sponsor_id,
+        "chamber": chamber.capitalize() if chamber else None,
+    })
+    filters = tuple(filter_params)
+
+    # Keyset position (latest_action_date, bill_id) of the previous page's last row
+    seek, seek_params = _decode_cursor(cursor) if cursor else (None, {})
+    if cursor:
+        offset = 0
+
     with get_db() as conn:
-        conditions: list[str] = []
-        params: list[object] = []
-
-        if q:
-            escaped = escape_like(q)
-            conditions.append(
-                "(b.title ILIKE ? ESCAPE '\\' OR b.short_title ILIKE ? ESCAPE '\\' "
-                "OR b.bill_id IN (SELECT bill_id FROM bill_subjects WHERE subject ILIKE ? ESCAPE '\\'))"
+        # Each search strategy is tried in turn until one matches something
+        searches = _search_modes(q) if q else [(None, {})]
+        for search, search_params in searches:
+            page_sql, count_sql, windowed = _build_bills_sql(
+                filters, search, seek, include_total,
             )
-            params.extend([f"%{escaped}%", f"%{escaped}%", f"%{escaped}%"])
-        if subject:
-            conditions.append("b.bill_id IN (SELECT bill_id FROM bill_subjects WHERE subject = ?)")
-            params.append(subject)
-        if congress:
-            conditions.append("b.congress = ?")
-            params.append(congress)
-        if status:
-            conditions.append("b.status = ?")
-            params.append(status)
-        if bill_type:
-            conditions.append("b.bill_type = ?")
-            params.append(bill_type.lower())
-        if policy_area:
-            conditions.append("b.policy_area = ?")
-            params.append(policy_area)
-        if sponsor_id:
-            conditions.append("b.sponsor_id = ?")
-            params.append(sponsor_id)
-        if chamber:
-            conditions.append("b.origin_chamber = ?")
-            params.append(chamber.capitalize())
-
-        where = " AND ".join(conditions) if conditions else "1=1"
-
-        total = conn.execute(
-            f"SELECT COUNT(*) FROM bills b WHERE {where}", params
-        ).fetchone()[0]
-
-        rows = conn.execute(
-            f"""
-            SELECT b.bill_id, b.congress, b.bill_type, b.bill_number,
-                   b.title, b.short_title, b.introduced_date,
-                   b.sponsor_id, m.full_name, m.party,
-                   b.policy_area, b.origin_chamber,
-                   b.latest_action, b.latest_action_date, b.status
-            FROM bills b
-            LEFT JOIN members m ON b.sponsor_id = m.bioguide_id
-            WHERE {where}
-            ORDER BY b.latest_action_date DESC NULLS LAST
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
-        ).fetchall()
+            params = {**search_params, **filter_params}
+            rows = conn.execute(
+                page_sql,
+                # One extra row tells us whether there is a next page
+                {**params, **seek_params, "limit": limit + 1, "offset": offset},
+            ).fetchall()
 
-        bills = [_row_to_bill(r) for r in rows]
-        return BillList(bills=bills, total=total, offset=offset, limit=limit)
+            if rows and windowed:
+                total = rows[0][15]
+            elif rows and not include_total:
+                total = None
+            elif rows or offset or seek:
+                # An empty page past the end must still tell an exhausted
+                # search apart from one that matched nothing
+                total = conn.execute(count_sql, params).fetchone()[0]
+            else:
+                total = 0
+            if rows or total:
+                break
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        # Rows map positionally onto Bill; the page is validated in one pass
+        return BillList.model_validate({
+            "bills": [dict(zip(_BILL_FIELDS, r)) for r in rows],
+            "total": total if include_total else None,
+            "offset": offset,
+            "limit": limit,
+            "next_cursor": _encode_cursor(rows[-1]) if has_more else None,
+        })
 
 
 @router.get("/{bill_id}", response_model=BillDetail)
 def get_bill(bill_id: str):
     """Get a single bill by ID with cosponsorship breakdown."""
     with get_db() as conn:
+        # Bill row, cosponsor breakdown and subjects in one round trip
         row = conn.execute(
             """
+            WITH cos AS (
+                SELECT
+                    count(*) as total,
+                    count(*) filter (where m.party = 'D') as dem,
+                    count(*) filter (where m.party = 'R') as rep,
+                    count(*) filter (where m.party not in ('D', 'R')) as ind
+                FROM bill_cosponsors c
+                LEFT JOIN members m ON c.bioguide_id = m.bioguide_id
+                WHERE c.bill_id = $bill_id
+            ),
+            subs AS (
+                SELECT list(subject ORDER BY subject) as subjects
+                FROM bill_subjects
+                WHERE bill_id = $bill_id
+            )
             SELECT b.bill_id, b.congress, b.bill_type, b.bill_number,
                    b.title, b.short_title, b.introduced_date,
                    b.sponsor_id, m.full_name, m.party,
                    b.policy_area, b.origin_chamber,
                    b.latest_action, b.latest_action_date, b.status,
-                   b.summary, b.full_text_url
+                   b.summary, b.full_text_url,
+                   cos.total, cos.dem, cos.rep, cos.ind, subs.subjects
             FROM bills b
             LEFT JOIN members m ON b.sponsor_id = m.bioguide_id
-            WHERE b.bill_id = ?
+            CROSS JOIN cos
+            CROSS JOIN subs
+            WHERE b.bill_id = $bill_id
             """,
-            [bill_id],
+            {"bill_id": bill_id},
         ).fetchone()
 
         if not row:
             raise HTTPException(status_code=404, detail="Bill not found")
 
-        try:
-            cosponsor_counts = conn.execute(
-                """
-                SELECT
-                    count(*) as total,
-                    count(*) filter (where m.party = 'D') as dem,
-                    count(*) filter (where m.party = 'R') as rep,
-                    count(*) filter (where m.party not in ('D', 'R')) as ind
-                FROM bill_cosponsors c
-                LEFT JOIN members m ON c.bioguide_id = m.bioguide_id
-                WHERE c.bill_id = ?
-                """,
-                [bill_id],
-            ).fetchone()
-        except Exception:
-            cosponsor_counts = (0, 0, 0, 0)
-
-        # Get subjects
-        try:
-            subject_rows = conn.execute(
-                "SELECT subject FROM bill_subjects WHERE bill_id = ? ORDER BY subject",
-                [bill_id],
-            ).fetchall()
-            subjects = [r[0] for r in subject_rows]
-        except Exception:
-            subjects = []
-
-        bill = _row_to_bill(row)
-        return BillDetail(
-            **bill.model_dump(),
-            summary=row[15],
-            full_text_url=row[16],
-            subjects=subjects,
-            total_cosponsors=cosponsor_counts[0],
-            dem_cosponsors=cosponsor_counts[1],
-            rep_cosponsors=cosponsor_counts[2],
-            ind_cosponsors=cosponsor_counts[3],
-        )
+        return BillDetail.model_validate({
+            **dict(zip(_BILL_FIELDS, row)),
+            "summary": row[15],
+            "full_text_url": row[16],
+            "subjects": row[21] or [],
+            "total_cosponsors": row[17],
+            "dem_cosponsors": row[18],
+            "rep_cosponsors": row[19],
+            "ind_cosponsors": row[20],
+        })
 
 
 @router.get("/{bill_id}/actions", response_model=BillActionList)
@@ -318,13 +308,7 @@ def get_bill_actions(bill_id: str):
     referral, floor votes, passage, signing, etc. Ordered chronologically.
     """
     with get_db() as conn:
-        exists = conn.execute(
-            "SELECT 1 FROM bills WHERE bill_id = ?", [bill_id]
-        ).fetchone()
-        if not exists:
-            raise HTTPException(status_code=404, detail="Bill not found")
-
-        rows = conn.execute(
+        conn.execute(
             """
             SELECT action_date, action_text, action_type, chamber
             FROM bill_actions
@@ -332,29 +316,19 @@ def get_bill_actions(bill_id: str):
             ORDER BY sequence ASC
             """,
             [bill_id],
-        ).fetchall()
+        )
+        actions = fetch_dicts(conn, _ACTION_FIELDS)
+        if not actions:
+            _assert_bill_exists(conn, bill_id)
 
-        actions = [
-            BillAction(
-                action_date=r[0], action_text=r[1],
-                action_type=r[2], chamber=r[3],
-            )
-            for r in rows
-        ]
-        return BillActionList(actions=actions, total=len(actions))
+        return BillActionList.model_validate({"actions": actions, "total": len(actions)})
 
 
 @router.get("/{bill_id}/votes", response_model=BillVoteList)
 def get_bill_votes(bill_id: str):
     """Get all roll call votes associated with a bill."""
     with get_db() as conn:
-        exists = conn.execute(
-            "SELECT 1 FROM bills WHERE bill_id = ?", [bill_id]
-        ).fetchone()
-        if not exists:
-            raise HTTPException(status_code=404, detail="Bill not found")
-
-        rows = conn.execute(
+        conn.execute(
             """
             SELECT vote_id, vote_date, chamber, question, result,
                    yea_count, nay_count
@@ -363,16 +337,12 @@ def get_bill_votes(bill_id: str):
             ORDER BY vote_date DESC NULLS LAST
             """,
             [bill_id],
-        ).fetchall()
+        )
+        votes = fetch_dicts(conn, _VOTE_FIELDS)
+        if not votes:
+            _assert_bill_exists(conn, bill_id)
 
-        votes = [
-            BillVote(
-                vote_id=r[0], vote_date=r[1], chamber=r[2], question=r[3],
-                result=r[4], yea_count=r[5], nay_count=r[6],
-            )
-            for r in rows
-        ]
-        return BillVoteList(votes=votes, total=len(votes))
+        return BillVoteList.model_validate({"votes": votes, "total": len(votes)})
 
 
 # ---------------------------------------------------------------------------
@@ -380,11 +350,160 @@ def get_bill_votes(bill_id: str):
 # ---------------------------------------------------------------------------
 
 
-def _row_to_bill(r: tuple) -> Bill:
-    return Bill(
-        bill_id=r[0], congress=r[1], bill_type=r[2], bill_number=r[3],
-        title=r[4], short_title=r[5], introduced_date=r[6],
-        sponsor_id=r[7], sponsor_name=r[8], sponsor_party=r[9],
-        policy_area=r[10], origin_chamber=r[11],
-        latest_action=r[12], latest_action_date=r[13], status=r[14],
-    )
+# Field names in the order the queries select them; trailing columns such
+# as the window total fall off the end of zip()
+_BILL_FIELDS = tuple(Bill.model_fields)
+_ACTION_FIELDS = tuple(BillAction.model_fields)
+_VOTE_FIELDS = tuple(BillVote.model_fields)
+
+
+def _assert_bill_exists(conn, bill_id: str) -> None:
+    """Raise 404 unless the bill exists.
+
+    Only consulted when a bill's child rows come back empty, so the common
+    path stays a single query.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM bills WHERE bill_id = ?", [bill_id]
+    ).fetchone()
+    if not exists:
+        raise HTTPException(status_code=404, detail="Bill not found")
+
+
+def _encode_cursor(r: tuple) -> str:
+    key = f"{r[13].isoformat() if r[13] else ''}|{r[0]}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, dict[str, object]]:
+    """Decode a bills cursor into a seek kind and its parameters."""
+    try:
+        raw_date, bill_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        action_date = date.fromisoformat(raw_date) if raw_date else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if action_date is None:
+        return "undated", {"seek_id": bill_id}
+    return "dated", {"seek_date": action_date, "seek_id": bill_id}
+
+
+def _search_modes(q: str) -> list[tuple[str, dict[str, object]]]:
+    """List the `q` search strategies to try, with their parameters.
+
+    The full-text index (see `sync search-index`) matches every word of the
+    query against titles and subjects; substring matching on the lowered
+    columns is the fallback when there is no index or it finds nothing.
+    """
+    modes = []
+    if has_search_index():
+        modes.append(("fts", {"q": q}))
+    modes.append(("substring", {"pattern": f"%{escape_like(q.lower())}%"}))
+    return modes
+
+
+_BILL_FILTERS = {
+    "subject": "b.bill_id IN (SELECT bill_id FROM bill_subjects WHERE subject = $subject)",
+    "congress": "b.congress = $congress",
+    "status": "b.status = $status",
+    "bill_type": "b.bill_type = $bill_type",
+    "policy_area": "b.policy_area = $policy_area",
+    "sponsor_id": "b.sponsor_id = $sponsor_id",
+    "chamber": "b.origin_chamber = $chamber",
+}
+
+# (CTE, condition) per search mode. Matches are resolved once into a bill
+# set shared by the count and page queries.
+_BILL_SEARCHES = {
+    "fts": (
+        "search_hits AS (SELECT bill_id FROM ("
+        "SELECT bill_id, fts_main_bill_search.match_bm25(bill_id, $q, conjunctive := 1) AS score "
+        "FROM bill_search) WHERE score IS NOT NULL)",
+        "b.bill_id IN (SELECT bill_id FROM search_hits)",
+    ),
+    "substring": (
+        "subject_hits AS (SELECT DISTINCT bill_id FROM bill_subjects "
+        "WHERE subject_lower LIKE $pattern ESCAPE '\\')",
+        "(b.title_lower LIKE $pattern ESCAPE '\\' OR b.short_title_lower LIKE $pattern ESCAPE '\\' "
+        "OR b.bill_id IN (SELECT bill_id FROM subject_hits))",
+    ),
+}
+
+# Rows after the cursor under ORDER BY latest_action_date DESC NULLS LAST, bill_id DESC
+_BILL_SEEKS = {
+    "dated": (
+        "(b.latest_action_date < $seek_date "
+        "OR (b.latest_action_date = $seek_date AND b.bill_id < $seek_id) "
+        "OR b.latest_action_date IS NULL)"
+    ),
+    "undated": "(b.latest_action_date IS NULL AND b.bill_id < $seek_id)",
+}
+
+
+@lru_cache(maxsize=256)
+def _build_bills_sql(
+    filters: tuple[str, ...], search: str | None, seek: str | None, with_total: bool,
+) -> tuple[str, str, bool]:
+    """Build (page SQL, count SQL, windowed) for one filter combination.
+
+    Cached per shape, so repeat requests skip string assembly entirely.
+    """
+    ctes = []
+    conditions = [_BILL_FILTERS[f] for f in filters]
+    if search:
+        search_cte, search_condition = _BILL_SEARCHES[search]
+        ctes.append(search_cte)
+        conditions.insert(0, search_condition)
+
+    where = " AND ".join(conditions) or "1=1"
+    page_where = f"{where} AND {_BILL_SEEKS[seek]}" if seek else where
+    # A window total forces the whole filtered set through the sort; the
+    # unfiltered listing keeps its top-N plan and a separate count. Past a
+    # cursor the window would only see the remaining rows.
+    windowed = with_total and bool(conditions) and not seek
+    total_column = "COUNT(*) OVER ()" if windowed else "NULL"
+
+    # The page is picked on narrow sort keys first; the wide columns and
+    # sponsor join are only fetched for the rows that survive
+    page_cte = f"""
+        page AS (
+            SELECT b.bill_id, b.latest_action_date, {total_column} AS _total
+            FROM bills b
+            WHERE {page_where}
+            ORDER BY b.latest_action_date DESC NULLS LAST, b.bill_id DESC
+            LIMIT $limit OFFSET $offset
+        )"""
+    page_sql = f"""
+        WITH {", ".join(ctes + [page_cte])}
+        SELECT b.bill_id, b.congress, b.bill_type, b.bill_number,
+               b.title, b.short_title, b.introduced_date,
+               b.sponsor_id, m.full_name, m.party,
+               b.policy_area, b.origin_chamber,
+               b.latest_action, b.latest_action_date, b.status,
+               page._total
+        FROM page
+        JOIN bills b ON b.bill_id = page.bill_id
+        LEFT JOIN members m ON b.sponsor_id = m.bioguide_id
+        ORDER BY page.latest_action_date DESC NULLS LAST, page.bill_id DESC
+    """
+    with_clause = f"WITH {', '.join(ctes)}" if ctes else ""
+    count_sql = f"{with_clause} SELECT COUNT(*) FROM bills b WHERE {where}"
+    return page_sql, count_sql, windowed
+
+
+@lru_cache(maxsize=None)
+def _build_subjects_sql(has_q: bool, with_total: bool) -> tuple[str, str]:
+    """Build (page SQL, count SQL) for the subject list."""
+    where = "WHERE bs.subject_lower LIKE $pattern ESCAPE '\\'" if has_q else ""
+    total_column = "count(*) OVER ()" if with_total else "NULL"
+    page_sql = f"""
+        SELECT bs.subject, count(*) as bill_count,
+               {total_column} as _total
+        FROM bill_subjects bs
+        {where}
+        GROUP BY bs.subject
+        ORDER BY bill_count DESC
+        LIMIT $limit OFFSET $offset
+    """
+    count_sql = f"SELECT count(DISTINCT subject) FROM bill_subjects bs {where}"
+    return page_sql, count_sql
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
@@ -41,7 +43,7 @@ class CommitteeDetail(Committee):
 
 class CommitteeList(BaseModel):
     committees: list[Committee]
-    total: int
+    total: int | None = None
     offset: int
     limit: int
 
@@ -57,100 +59,110 @@ def list_committees(
     chamber: str | None = Query(None, description="Filter by chamber: house, senate"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    include_total: bool = Query(False, description="Also count all matches (costs an extra scan)"),
 ):
-    """List congressional committees with member counts."""
-    with get_db() as conn:
-        conditions: list[str] = []
-        params: list[object] = []
-
-        if q:
-            conditions.append("c.name ILIKE ? ESCAPE '\\'")
-            params.append(f"%{escape_like(q)}%")
-        if chamber:
-            conditions.append("c.chamber = ?")
-            params.append(chamber.lower())
+    """List congressional committees with member counts.
 
-        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-        total = conn.execute(
-            f"SELECT count(*) FROM committees c {where}", params
-        ).fetchone()[0]
+    `total` is null unless `include_total` is set.
+    """
+    params: dict[str, object] = {}
+    if q:
+        params["pattern"] = f"%{escape_like(q.lower())}%"
+    if chamber:
+        params["chamber"] = chamber.lower()
+    page_sql, count_sql = _build_committees_sql(bool(q), bool(chamber), include_total)
 
+    with get_db() as conn:
         rows = conn.execute(
-            f"""
-            SELECT c.committee_id, c.name, c.chamber, c.committee_type,
-                   c.parent_id, c.url,
-                   coalesce(cm_counts.member_count, 0) as member_count
-            FROM committees c
-            LEFT JOIN (
-                SELECT committee_id, count(*) as member_count
-                FROM committee_members
-                GROUP BY committee_id
-            ) cm_counts ON cm_counts.committee_id = c.committee_id
-            {where}
-            ORDER BY c.name
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+            page_sql, {**params, "limit": limit, "offset": offset}
         ).fetchall()
 
-        committees = [
-            Committee(
-                committee_id=r[0], name=r[1], chamber=r[2],
-                committee_type=r[3], parent_id=r[4], url=r[5],
-                member_count=r[6],
-            )
-            for r in rows
-        ]
-        return CommitteeList(committees=committees, total=total, offset=offset, limit=limit)
+        if not include_total:
+            total = None
+        elif rows:
+            total = rows[0][7]
+        elif offset:
+            total = conn.execute(count_sql, params).fetchone()[0]
+        else:
+            total = 0
+
+        # Rows map positionally onto Committee; the page is validated in one pass
+        return CommitteeList.model_validate({
+            "committees": [dict(zip(_COMMITTEE_FIELDS, r)) for r in rows],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        })
 
 
 @router.get("/{committee_id}", response_model=CommitteeDetail)
 def get_committee(committee_id: str):
     """Get a committee with its full member list."""
     with get_db() as conn:
+        # Committee row and its roster in one round trip; the roster comes
+        # back as a list of structs already keyed like CommitteeMember
         row = conn.execute(
             """
+            WITH roster AS (
+                SELECT list({
+                    'bioguide_id': cm.bioguide_id, 'full_name': m.full_name,
+                    'party': m.party, 'state': m.state, 'chamber': m.chamber,
+                    'role': cm.role, 'image_url': m.image_url
+                } ORDER BY cm.role_rank, m.last_name) as members
+                FROM committee_members cm
+                JOIN members m ON cm.bioguide_id = m.bioguide_id
+                WHERE cm.committee_id = $committee_id
+            )
             SELECT c.committee_id, c.name, c.chamber, c.committee_type,
-                   c.parent_id, c.url
+                   c.parent_id, c.url, roster.members
             FROM committees c
-            WHERE c.committee_id = ?
+            CROSS JOIN roster
+            WHERE c.committee_id = $committee_id
             """,
-            [committee_id],
+            {"committee_id": committee_id},
         ).fetchone()
 
         if not row:
             raise HTTPException(status_code=404, detail="Committee not found")
 
-        member_rows = conn.execute(
-            """
-            SELECT cm.bioguide_id, m.full_name, m.party, m.state, m.chamber,
-                   cm.role, m.image_url
-            FROM committee_members cm
-            JOIN members m ON cm.bioguide_id = m.bioguide_id
-            WHERE cm.committee_id = ?
-            ORDER BY
-                CASE cm.role
-                    WHEN 'Chair' THEN 1
-                    WHEN 'Ranking Member' THEN 2
-                    WHEN 'Vice Chair' THEN 3
-                    ELSE 4
-                END,
-                m.last_name
-            """,
-            [committee_id],
-        ).fetchall()
+        members = row[6] or []
+        return CommitteeDetail.model_validate({
+            **dict(zip(_COMMITTEE_FIELDS, row)),
+            "member_count": len(members),
+            "members": members,
+        })
 
-        members = [
-            CommitteeMember(
-                bioguide_id=r[0], full_name=r[1], party=r[2],
-                state=r[3], chamber=r[4], role=r[5], image_url=r[6],
-            )
-            for r in member_rows
-        ]
-
-        return CommitteeDetail(
-            committee_id=row[0], name=row[1], chamber=row[2],
-            committee_type=row[3], parent_id=row[4], url=row[5],
-            member_count=len(members), members=members,
-        )
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+# Field names in the order the queries select them
+_COMMITTEE_FIELDS = tuple(Committee.model_fields)
+
+
+@lru_cache(maxsize=None)
+def _build_committees_sql(
+    has_q: bool, has_chamber: bool, with_total: bool,
+) -> tuple[str, str]:
+    """Build (page SQL, count SQL) for one filter combination."""
+    conditions = []
+    if has_q:
+        conditions.append("c.name_lower LIKE $pattern ESCAPE '\\'")
+    if has_chamber:
+        conditions.append("c.chamber = $chamber")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    total_column = "count(*) OVER ()" if with_total else "NULL"
+
+    page_sql = f"""
+        SELECT c.committee_id, c.name, c.chamber, c.committee_type,
+               c.parent_id, c.url, coalesce(c.member_count, 0),
+               {total_column} as _total
+        FROM committees c
+        {where}
+        ORDER BY c.name
+        LIMIT $limit OFFSET $offset
+    """
+    count_sql = f"SELECT count(*) FROM committees c {where}"
+    return page_sql, count_sql
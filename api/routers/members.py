@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
+from functools import lru_cache
 
+from anyio import to_thread
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from api.database import PASSAGE_VOTE_FILTER, escape_like, get_db
+from api.cache import ttl_cache
+from api.database import PASSAGE_VOTE_FILTER, bind_filters, escape_like, get_db, has_table
 
 router = APIRouter()
 
@@ -130,6 +134,7 @@ class MemberBillList(BaseModel):
 
 
 @router.get("/by-zip/{zip_code}", response_model=MemberList)
+@ttl_cache(seconds=3600, maxsize=1024)
 def get_members_by_zip(zip_code: str):
     """Find representatives and senators for a zip code.
 
@@ -144,21 +149,25 @@ def get_members_by_zip(zip_code: str):
         try:
             rows = conn.execute(
                 """
+                WITH z AS MATERIALIZED (
+                    -- Probed once; both legs read the matched districts
+                    SELECT state, district FROM zip_districts WHERE zcta = $zip_code
+                )
                 SELECT m.bioguide_id, m.first_name, m.last_name, m.full_name,
                        m.party, m.state, m.district, m.chamber, m.is_current,
                        m.image_url, m.official_url
-                FROM zip_districts z
+                FROM z
                 JOIN members m ON z.state = m.state AND z.district = m.district AND m.chamber = 'house'
-                WHERE z.zcta = ? AND m.is_current = TRUE
+                WHERE m.is_current = TRUE
                 UNION ALL
                 SELECT m.bioguide_id, m.first_name, m.last_name, m.full_name,
                        m.party, m.state, m.district, m.chamber, m.is_current,
                        m.image_url, m.official_url
                 FROM members m
-                WHERE m.state = (SELECT z.state FROM zip_districts z WHERE z.zcta = ? LIMIT 1)
+                WHERE m.state = (SELECT state FROM z LIMIT 1)
                   AND m.chamber = 'senate' AND m.is_current = TRUE
                 """,
-                [zip_code, zip_code],
+                {"zip_code": zip_code},
             ).fetchall()
         except Exception:
             raise HTTPException(
@@ -169,11 +178,16 @@ def get_members_by_zip(zip_code: str):
         if not rows:
             raise HTTPException(status_code=404, detail="No representatives found for this zip code")
 
-        members = [_row_to_member(r) for r in rows]
-        return MemberList(members=members, total=len(members), offset=0, limit=len(members))
+        return MemberList.model_validate({
+            "members": [dict(zip(_MEMBER_FIELDS, r)) for r in rows],
+            "total": len(rows),
+            "offset": 0,
+            "limit": len(rows),
+        })
 
 
 @router.get("", response_model=MemberList)
+@ttl_cache(seconds=3600)
 def list_members(
     chamber: str | None = Query(None, description="Filter by chamber: house, senate"),
     party: str | None = Query(None, description="Filter by party: D, R, I"),
@@ -183,47 +197,38 @@ def list_members(
     offset: int = Query(0, ge=0),
 ):
     """List all members of Congress."""
-    with get_db() as conn:
-        conditions: list[str] = []
-        params: list[object] = []
-
-        if current:
-            conditions.append("is_current = TRUE")
-        if chamber:
-            conditions.append("chamber = ?")
-            params.append(chamber.lower())
-        if party:
-            conditions.append("party = ?")
-            params.append(party.upper())
-        if state:
-            conditions.append("state = ?")
-            params.append(state.upper())
-
-        where = " AND ".join(conditions) if conditions else "1=1"
-
-        total = conn.execute(
-            f"SELECT COUNT(*) FROM members WHERE {where}", params
-        ).fetchone()[0]
+    filter_params = bind_filters({
+        "chamber": chamber.lower() if chamber else None,
+        "party": party.upper() if party else None,
+        "state": state.upper() if state else None,
+    })
+    page_sql, count_sql = _build_members_sql(current, tuple(filter_params))
 
+    with get_db() as conn:
         rows = conn.execute(
-            f"""
-            SELECT bioguide_id, first_name, last_name, full_name,
-                   party, state, district, chamber, is_current,
-                   image_url, official_url
-            FROM members
-            WHERE {where}
-            ORDER BY state, last_name
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+            page_sql, {**filter_params, "limit": limit, "offset": offset}
         ).fetchall()
 
-        members = [_row_to_member(r) for r in rows]
-        return MemberList(members=members, total=total, offset=offset, limit=limit)
+        # The window total rides along on every row; an empty page past the
+        # end still needs its own count
+        if rows:
+            total = rows[0][11]
+        elif offset:
+            total = conn.execute(count_sql, filter_params).fetchone()[0]
+        else:
+            total = 0
+
+        # Rows map positionally onto Member; the page is validated in one pass
+        return MemberList.model_validate({
+            "members": [dict(zip(_MEMBER_FIELDS, r)) for r in rows],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        })
 
 
 @router.get("/compare", response_model=MemberComparison)
-def compare_members(
+async def compare_members(
     ids: str = Query(..., description="Comma-separated bioguide IDs (e.g., A000001,B000002)"),
 ):
     """Compare two members side-by-side.
@@ -235,52 +240,29 @@ def compare_members(
     if len(id_list) != 2:
         raise HTTPException(status_code=400, detail="Provide exactly 2 bioguide IDs separated by a comma")
 
-    with get_db() as conn:
-        members = []
-        for bid in id_list:
-            detail = _build_member_detail(conn, bid)
-            if not detail:
-                raise HTTPException(status_code=404, detail=f"Member {bid} not found")
-            members.append(detail)
-
-        # Voting agreement: votes where both participated
-        agreement = conn.execute(
-            """
-            SELECT
-                count(*) as shared,
-                count(*) filter (where a.position = b.position) as agreed
-            FROM member_votes a
-            JOIN member_votes b ON a.vote_id = b.vote_id
-            WHERE a.bioguide_id = ? AND b.bioguide_id = ?
-              AND a.position NOT IN ('Not Voting', 'Present')
-              AND b.position NOT IN ('Not Voting', 'Present')
-            """,
-            id_list,
-        ).fetchone()
-
-        shared_votes = agreement[0] if agreement else 0
-        agreed = agreement[1] if agreement else 0
-        agreement_rate = round(100.0 * agreed / shared_votes, 1) if shared_votes > 0 else None
+    # Both member bundles and the overlap query run concurrently, each on
+    # its own worker thread and cursor
+    *details, overlap = await asyncio.gather(
+        *(to_thread.run_sync(_get_member_detail, bid) for bid in id_list),
+        to_thread.run_sync(_get_member_overlap, *id_list),
+    )
+    for bid, detail in zip(id_list, details):
+        if not detail:
+            raise HTTPException(status_code=404, detail=f"Member {bid} not found")
 
-        # Bills both cosponsored
-        shared_bills = conn.execute(
-            """
-            SELECT count(*) FROM bill_cosponsors a
-            JOIN bill_cosponsors b ON a.bill_id = b.bill_id
-            WHERE a.bioguide_id = ? AND b.bioguide_id = ?
-            """,
-            id_list,
-        ).fetchone()[0]
+    shared_votes, agreed, shared_bills = overlap
+    agreement_rate = round(100.0 * agreed / shared_votes, 1) if shared_votes > 0 else None
 
-        return MemberComparison(
-            members=members,
-            shared_votes=shared_votes,
-            agreement_rate=agreement_rate,
-            shared_bills_cosponsored=shared_bills,
-        )
+    return MemberComparison(
+        members=details,
+        shared_votes=shared_votes,
+        agreement_rate=agreement_rate,
+        shared_bills_cosponsored=shared_bills,
+    )
 
 
 @router.get("/{bioguide_id}", response_model=MemberDetail)
+@ttl_cache(seconds=3600, maxsize=1024)
 def get_member(bioguide_id: str):
     """Get a single member with enriched stats.
 
@@ -288,7 +270,7 @@ def get_member(bioguide_id: str):
     sponsorship metrics, voting attendance, and party loyalty.
     """
     with get_db() as conn:
-        detail = _build_member_detail(conn, bioguide_id)
+        detail = _fetch_member_bundle(conn, bioguide_id)
         if not detail:
             raise HTTPException(status_code=404, detail="Member not found")
         return detail
@@ -308,56 +290,30 @@ def get_member_votes(
     Filter by `subject` to answer "how did my rep vote on healthcare?"
     Use `passage_only=true` to skip procedural votes and see substantive ones.
     """
-    with get_db() as conn:
-        _assert_member_exists(conn, bioguide_id)
-
-        conditions = ["mv.bioguide_id = ?"]
-        params: list[object] = [bioguide_id]
-
-        joins = "JOIN votes v ON mv.vote_id = v.vote_id"
-
-        if subject:
-            joins += " JOIN bills b ON v.bill_id = b.bill_id JOIN bill_subjects bs ON b.bill_id = bs.bill_id"
-            conditions.append("bs.subject ILIKE ? ESCAPE '\\'")
-            params.append(f"%{escape_like(subject)}%")
-
-        if policy_area:
-            if "bills b" not in joins:
-                joins += " JOIN bills b ON v.bill_id = b.bill_id"
-            conditions.append("b.policy_area = ?")
-            params.append(policy_area)
-
-        if passage_only:
-            conditions.append(PASSAGE_VOTE_FILTER.replace("question", "v.question"))
-
-        where = " AND ".join(conditions)
-
-        total = conn.execute(
-            f"SELECT COUNT(*) FROM member_votes mv {joins} WHERE {where}",
-            params,
-        ).fetchone()[0]
+    filter_params = bind_filters({
+        "subject": f"%{escape_like(subject.lower())}%" if subject else None,
+        "policy_area": policy_area,
+    })
+    page_sql, count_sql = _build_member_votes_sql(tuple(filter_params), passage_only)
+    params = {"bioguide_id": bioguide_id, **filter_params}
 
+    with get_db() as conn:
         rows = conn.execute(
-            f"""
-            SELECT v.vote_id, v.vote_date, v.chamber, v.question,
-                   v.description, v.result, v.bill_id, mv.position
-            FROM member_votes mv
-            {joins}
-            WHERE {where}
-            ORDER BY v.vote_date DESC NULLS LAST
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+            page_sql, {**params, "limit": limit, "offset": offset}
         ).fetchall()
 
-        votes = [
-            MemberVote(
-                vote_id=r[0], vote_date=r[1], chamber=r[2], question=r[3],
-                description=r[4], result=r[5], bill_id=r[6], position=r[7],
-            )
-            for r in rows
-        ]
-        return MemberVoteList(votes=votes, total=total, offset=offset, limit=limit)
+        if rows:
+            total = rows[0][8]
+        else:
+            _assert_member_exists(conn, bioguide_id)
+            total = conn.execute(count_sql, params).fetchone()[0] if offset else 0
+
+        return MemberVoteList.model_validate({
+            "votes": [dict(zip(_VOTE_FIELDS, r)) for r in rows],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        })
 
 
 @router.get("/{bioguide_id}/bills", response_model=MemberBillList)
@@ -403,6 +359,8 @@ def get_member_bills(
             """
             params = [bioguide_id, bioguide_id]
 
+        # Counted separately: the counts are cheap single-table scans, while
+        # a window total would force both arms through the sort in full
         total = conn.execute(count_query, params).fetchone()[0]
 
         rows = conn.execute(
@@ -414,14 +372,12 @@ def get_member_bills(
             params + [limit, offset],
         ).fetchall()
 
-        bills = [
-            MemberBill(
-                bill_id=r[0], bill_type=r[1], bill_number=r[2], title=r[3],
-                introduced_date=r[4], status=r[5], policy_area=r[6], role=r[7],
-            )
-            for r in rows
-        ]
-        return MemberBillList(bills=bills, total=total, offset=offset, limit=limit)
+        return MemberBillList.model_validate({
+            "bills": [dict(zip(_BILL_FIELDS, r)) for r in rows],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        })
 
 
 # ---------------------------------------------------------------------------
@@ -429,138 +385,198 @@ def get_member_bills(
 # ---------------------------------------------------------------------------
 
 
-def _row_to_member(r: tuple) -> Member:
-    return Member(
-        bioguide_id=r[0], first_name=r[1], last_name=r[2], full_name=r[3],
-        party=r[4], state=r[5], district=r[6], chamber=r[7], is_current=r[8],
-        image_url=r[9], official_url=r[10],
-    )
+# Field names in the order the queries select them
+_MEMBER_FIELDS = tuple(Member.model_fields)
+_VOTE_FIELDS = tuple(MemberVote.model_fields)
+_BILL_FIELDS = tuple(MemberBill.model_fields)
 
 
-def _get_committees(conn, bioguide_id: str) -> list[MemberCommittee]:
-    """Get committee assignments for a member."""
-    try:
-        rows = conn.execute(
-            """
-            SELECT cm.committee_id, c.name, cm.role
-            FROM committee_members cm
-            JOIN committees c ON cm.committee_id = c.committee_id
-            WHERE cm.bioguide_id = ?
-            ORDER BY c.name
-            """,
-            [bioguide_id],
-        ).fetchall()
-        return [MemberCommittee(committee_id=r[0], name=r[1], role=r[2]) for r in rows]
-    except Exception:
-        return []
+_MEMBER_FILTERS = {
+    "chamber": "chamber = $chamber",
+    "party": "party = $party",
+    "state": "state = $state",
+}
 
 
-def _get_recent_votes(conn, bioguide_id: str, limit: int = 5) -> list[RecentVote]:
-    """Get a member's most recent votes."""
-    rows = conn.execute(
-        """
-        SELECT v.vote_id, v.vote_date, v.question, mv.position
+@lru_cache(maxsize=None)
+def _build_members_sql(current: bool, filters: tuple[str, ...]) -> tuple[str, str]:
+    """Build (page SQL, count SQL) for one filter combination."""
+    conditions = [_MEMBER_FILTERS[f] for f in filters]
+    if current:
+        conditions.insert(0, "is_current = TRUE")
+    where = " AND ".join(conditions) or "1=1"
+
+    page_sql = f"""
+        SELECT bioguide_id, first_name, last_name, full_name,
+               party, state, district, chamber, is_current,
+               image_url, official_url, count(*) OVER () as _total
+        FROM members
+        WHERE {where}
+        ORDER BY state, last_name
+        LIMIT $limit OFFSET $offset
+    """
+    count_sql = f"SELECT COUNT(*) FROM members WHERE {where}"
+    return page_sql, count_sql
+
+
+_MEMBER_VOTE_FILTERS = {
+    # Semi join: a vote is listed once however many subjects match
+    "subject": (
+        "v.bill_id IN (SELECT bill_id FROM bill_subjects "
+        "WHERE subject_lower LIKE $subject ESCAPE '\\')"
+    ),
+    "policy_area": "b.policy_area = $policy_area",
+}
+
+
+@lru_cache(maxsize=None)
+def _build_member_votes_sql(
+    filters: tuple[str, ...], passage_only: bool,
+) -> tuple[str, str]:
+    """Build (page SQL, count SQL) for one member-votes filter combination."""
+    joins = "JOIN votes v ON mv.vote_id = v.vote_id"
+    if "policy_area" in filters:
+        joins += " JOIN bills b ON v.bill_id = b.bill_id"
+    conditions = ["mv.bioguide_id = $bioguide_id", *(_MEMBER_VOTE_FILTERS[f] for f in filters)]
+    if passage_only:
+        conditions.append(f"v.{PASSAGE_VOTE_FILTER}")
+    where = " AND ".join(conditions)
+
+    page_sql = f"""
+        SELECT v.vote_id, v.vote_date, v.chamber, v.question,
+               v.description, v.result, v.bill_id, mv.position,
+               count(*) OVER () as _total
         FROM member_votes mv
-        JOIN votes v ON mv.vote_id = v.vote_id
-        WHERE mv.bioguide_id = ?
+        {joins}
+        WHERE {where}
         ORDER BY v.vote_date DESC NULLS LAST
-        LIMIT ?
-        """,
-        [bioguide_id, limit],
-    ).fetchall()
-    return [
-        RecentVote(vote_id=r[0], vote_date=r[1], question=r[2], position=r[3])
-        for r in rows
-    ]
-
-
-def _get_recent_bills(conn, bioguide_id: str, limit: int = 5) -> list[RecentBill]:
-    """Get a member's most recently sponsored bills."""
-    rows = conn.execute(
-        """
-        SELECT bill_id, title, introduced_date, status
-        FROM bills
-        WHERE sponsor_id = ?
-        ORDER BY introduced_date DESC NULLS LAST
-        LIMIT ?
-        """,
-        [bioguide_id, limit],
-    ).fetchall()
-    return [
-        RecentBill(bill_id=r[0], title=r[1], introduced_date=r[2], status=r[3])
-        for r in rows
-    ]
-
-
-def _build_member_detail(conn, bioguide_id: str) -> MemberDetail | None:
-    """Build a full MemberDetail with stats, contact info, committees, and recent activity."""
-    # Try fct_members first (has computed stats), join contact fields from members
-    try:
-        row = conn.execute(
+        LIMIT $limit OFFSET $offset
+    """
+    count_sql = f"SELECT COUNT(*) FROM member_votes mv {joins} WHERE {where}"
+    return page_sql, count_sql
+
+
+# Field names in the order the member bundle query selects them
+_DETAIL_FIELDS = (
+    *Member.model_fields,
+    "phone", "office_address", "contact_form", "twitter", "facebook", "youtube",
+    "leadership_role", "start_date",
+    "committees", "recent_votes", "recent_bills",
+    "bills_sponsored", "bills_enacted", "bills_passed", "sponsor_success_rate",
+    "total_roll_calls", "votes_missed", "attendance_rate", "party_loyalty_pct",
+    "activity_score",
+)
+
+
+def _get_member_detail(bioguide_id: str) -> MemberDetail | None:
+    """Fetch one member bundle on its own cursor (safe to run in a worker thread)."""
+    with get_db() as conn:
+        return _fetch_member_bundle(conn, bioguide_id)
+
+
+def _get_member_overlap(a: str, b: str) -> tuple[int, int, int]:
+    """Return (shared votes, agreed votes, shared cosponsored bills) for two members."""
+    with get_db() as conn:
+        return conn.execute(
             """
-            SELECT f.bioguide_id, f.first_name, f.last_name, f.full_name,
-                   f.party, f.state, f.district, f.chamber, f.is_current,
-                   f.image_url, f.official_url, f.leadership_role, f.start_date,
-                   f.bills_sponsored, f.bills_enacted, f.bills_passed, f.sponsor_success_rate,
-                   f.total_roll_calls, f.votes_missed, f.attendance_rate, f.party_loyalty_pct,
-                   f.activity_score,
-                   m.phone, m.office_address
-            FROM fct_members f
-            JOIN members m ON f.bioguide_id = m.bioguide_id
-            WHERE f.bioguide_id = ?
+            WITH agreement AS (
+                -- Votes where both participated
+                SELECT
+                    count(*) as shared,
+                    count(*) filter (where a.position = b.position) as agreed
+                FROM member_votes a
+                JOIN member_votes b ON a.vote_id = b.vote_id
+                WHERE a.bioguide_id = $a AND b.bioguide_id = $b
+                  AND a.position NOT IN ('Not Voting', 'Present')
+                  AND b.position NOT IN ('Not Voting', 'Present')
+            ),
+            shared_bills AS (
+                -- Bills both cosponsored
+                SELECT count(*) as shared
+                FROM bill_cosponsors a
+                JOIN bill_cosponsors b ON a.bill_id = b.bill_id
+                WHERE a.bioguide_id = $a AND b.bioguide_id = $b
+            )
+            SELECT agreement.shared, agreement.agreed, shared_bills.shared
+            FROM agreement, shared_bills
             """,
-            [bioguide_id],
+            {"a": a, "b": b},
         ).fetchone()
-    except Exception:
-        row = None
 
+
+def _fetch_member_bundle(conn, bioguide_id: str) -> MemberDetail | None:
+    """Build a full MemberDetail with stats, contact info, committees, and recent activity.
+
+    Every sub-list comes back from one query as a list of structs.
+    """
+    # fct_members is built by dbt; without it members come back without stats
+    sql = _build_member_bundle_sql(has_table("fct_members"))
+    row = conn.execute(sql, {"bioguide_id": bioguide_id}).fetchone()
     if not row:
-        # Fallback to raw members table
-        raw = conn.execute(
-            """
-            SELECT bioguide_id, first_name, last_name, full_name,
-                   party, state, district, chamber, is_current,
-                   image_url, official_url,
-                   phone, office_address
-            FROM members WHERE bioguide_id = ?
-            """,
-            [bioguide_id],
-        ).fetchone()
-        if not raw:
-            return None
-
-    # Member exists -- fetch enrichment data
-    committees = _get_committees(conn, bioguide_id)
-    recent_votes = _get_recent_votes(conn, bioguide_id)
-    recent_bills = _get_recent_bills(conn, bioguide_id)
-
-    if row:
-        return MemberDetail(
-            bioguide_id=row[0], first_name=row[1], last_name=row[2],
-            full_name=row[3], party=row[4], state=row[5], district=row[6],
-            chamber=row[7], is_current=row[8], image_url=row[9],
-            official_url=row[10], leadership_role=row[11], start_date=row[12],
-            bills_sponsored=row[13] or 0, bills_enacted=row[14] or 0,
-            bills_passed=row[15] or 0, sponsor_success_rate=row[16] or 0,
-            total_roll_calls=row[17] or 0, votes_missed=row[18] or 0,
-            attendance_rate=row[19], party_loyalty_pct=row[20],
-            activity_score=row[21],
-            phone=row[22], office_address=row[23],
-            committees=committees,
-            recent_votes=recent_votes,
-            recent_bills=recent_bills,
-        )
-
-    # raw was fetched in the fallback check above
-    return MemberDetail(
-        bioguide_id=raw[0], first_name=raw[1], last_name=raw[2],
-        full_name=raw[3], party=raw[4], state=raw[5], district=raw[6],
-        chamber=raw[7], is_current=raw[8], image_url=raw[9],
-        official_url=raw[10],
-        phone=raw[11], office_address=raw[12],
-        committees=committees, recent_votes=recent_votes,
-        recent_bills=recent_bills,
-    )
+        return None
+    return MemberDetail.model_validate(dict(zip(_DETAIL_FIELDS, row)))
+
+
+@lru_cache(maxsize=None)
+def _build_member_bundle_sql(with_stats: bool) -> str:
+    """Build the member bundle query, with or without fct_members stats."""
+    if with_stats:
+        stats = """
+               coalesce(f.bills_sponsored, 0), coalesce(f.bills_enacted, 0),
+               coalesce(f.bills_passed, 0), coalesce(f.sponsor_success_rate, 0),
+               coalesce(f.total_roll_calls, 0), coalesce(f.votes_missed, 0),
+               f.attendance_rate, f.party_loyalty_pct, f.activity_score"""
+        stats_join = "LEFT JOIN fct_members f ON f.bioguide_id = m.bioguide_id"
+    else:
+        stats = "0, 0, 0, 0, 0, 0, NULL, NULL, NULL"
+        stats_join = ""
+
+    # Each sub-list is an uncorrelated subquery on the same ID, so the
+    # recent votes and bills keep their top-N plans
+    return f"""
+        SELECT m.bioguide_id, m.first_name, m.last_name, m.full_name,
+               m.party, m.state, m.district, m.chamber, m.is_current,
+               m.image_url, m.official_url,
+               m.phone, m.office_address, m.contact_form,
+               m.twitter, m.facebook, m.youtube,
+               m.leadership_role, m.start_date,
+               coalesce((
+                   SELECT list({{'committee_id': cm.committee_id, 'name': c.name,
+                                 'role': cm.role}} ORDER BY c.name)
+                   FROM committee_members cm
+                   JOIN committees c ON cm.committee_id = c.committee_id
+                   WHERE cm.bioguide_id = $bioguide_id
+               ), []),
+               coalesce((
+                   SELECT list({{'vote_id': rv.vote_id, 'vote_date': rv.vote_date,
+                                 'question': rv.question, 'position': rv.position}}
+                               ORDER BY rv.vote_date DESC NULLS LAST)
+                   FROM (
+                       SELECT v.vote_id, v.vote_date, v.question, mv.position
+                       FROM member_votes mv
+                       JOIN votes v ON mv.vote_id = v.vote_id
+                       WHERE mv.bioguide_id = $bioguide_id
+                       ORDER BY v.vote_date DESC NULLS LAST
+                       LIMIT 5
+                   ) rv
+               ), []),
+               coalesce((
+                   SELECT list({{'bill_id': rb.bill_id, 'title': rb.title,
+                                 'introduced_date': rb.introduced_date, 'status': rb.status}}
+                               ORDER BY rb.introduced_date DESC NULLS LAST)
+                   FROM (
+                       SELECT bill_id, title, introduced_date, status
+                       FROM bills
+                       WHERE sponsor_id = $bioguide_id
+                       ORDER BY introduced_date DESC NULLS LAST
+                       LIMIT 5
+                   ) rb
+               ), []),
+               {stats}
+        FROM members m
+        {stats_join}
+        WHERE m.bioguide_id = $bioguide_id
+    """
 
 
 def _assert_member_exists(conn, bioguide_id: str):
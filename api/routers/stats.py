@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from api.database import get_db
+from api.cache import ttl_cache
+from api.database import bind_filters, get_db
 
 logger = logging.getLogger(__name__)
 
@@ -83,12 +85,14 @@ class MemberScorecard(BaseModel):
 
 
 @router.get("/congress-summary", response_model=list[CongressSummary])
+@ttl_cache(seconds=3600)
 def congress_summary():
     """High-level bill statistics per Congress."""
     return _query_agg("agg_congress_summary", CongressSummary)
 
 
 @router.get("/policy-breakdown", response_model=list[PolicyBreakdown])
+@ttl_cache(seconds=3600)
 def policy_breakdown(
     congress: int | None = Query(None, description="Filter by congress number"),
 ):
@@ -99,18 +103,21 @@ def policy_breakdown(
 
 
 @router.get("/chamber-comparison", response_model=list[ChamberComparison])
+@ttl_cache(seconds=3600)
 def chamber_comparison():
     """House vs Senate bill statistics."""
     return _query_agg("agg_chamber_comparison", ChamberComparison)
 
 
 @router.get("/party-breakdown", response_model=list[PartyBreakdown])
+@ttl_cache(seconds=3600)
 def party_breakdown():
     """Democratic vs Republican sponsorship and enactment stats."""
     return _query_agg("agg_party_breakdown", PartyBreakdown)
 
 
 @router.get("/member-scorecard", response_model=list[MemberScorecard])
+@ttl_cache(seconds=3600)
 def member_scorecard(
     chamber: str | None = Query(None, description="Filter by chamber: house, senate"),
     party: str | None = Query(None, description="Filter by party: D, R, I"),
@@ -124,49 +131,26 @@ def member_scorecard(
     if sort not in allowed_sorts:
         raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(allowed_sorts)}")
 
-    conditions: list[str] = []
-    params: list[object] = []
-
-    if chamber:
-        conditions.append("chamber = ?")
-        params.append(chamber.lower())
-    if party:
-        conditions.append("party = ?")
-        params.append(party.upper())
-    if state:
-        conditions.append("state = ?")
-        params.append(state.upper())
-
-    where = "WHERE " + " AND ".join(conditions) if conditions else ""
+    filter_params = bind_filters({
+        "chamber": chamber.lower() if chamber else None,
+        "party": party.upper() if party else None,
+        "state": state.upper() if state else None,
+    })
 
     with get_db() as conn:
         try:
             rows = conn.execute(
-                f"""
-                SELECT bioguide_id, full_name, party, state, chamber,
-                       bills_sponsored, bills_enacted, bills_passed, sponsor_success_rate,
-                       total_roll_calls, votes_missed, attendance_rate, party_loyalty_pct,
-                       activity_score
-                FROM agg_member_scorecard
-                {where}
-                ORDER BY {sort} DESC NULLS LAST
-                LIMIT ? OFFSET ?
-                """,
-                params + [limit, offset],
+                _build_scorecard_sql(tuple(filter_params), sort),
+                {**filter_params, "limit": limit, "offset": offset},
             ).fetchall()
         except Exception as exc:
             logger.exception("Failed to query agg_member_scorecard")
             raise HTTPException(status_code=503, detail="Scorecard not available — run dbt first") from exc
 
-        return [
-            MemberScorecard(
-                bioguide_id=r[0], full_name=r[1], party=r[2], state=r[3], chamber=r[4],
-                bills_sponsored=r[5], bills_enacted=r[6], bills_passed=r[7],
-                sponsor_success_rate=r[8], total_roll_calls=r[9], votes_missed=r[10],
-                attendance_rate=r[11], party_loyalty_pct=r[12], activity_score=r[13],
-            )
-            for r in rows
-        ]
+        # Rows map positionally onto MemberScorecard; validated in one pass
+        return _list_adapter(MemberScorecard).validate_python(
+            [dict(zip(_SCORECARD_FIELDS, r)) for r in rows]
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -174,6 +158,32 @@ def member_scorecard(
 # ---------------------------------------------------------------------------
 
 
+_SCORECARD_FIELDS = tuple(MemberScorecard.model_fields)
+
+_SCORECARD_FILTERS = {
+    "chamber": "chamber = $chamber",
+    "party": "party = $party",
+    "state": "state = $state",
+}
+
+
+@lru_cache(maxsize=None)
+def _build_scorecard_sql(filters: tuple[str, ...], sort: str) -> str:
+    """Build the scorecard page SQL for one filter combination and sort column."""
+    conditions = [_SCORECARD_FILTERS[f] for f in filters]
+    where = "WHERE " + " AND ".join(conditions) if conditions else ""
+    return f"""
+        SELECT bioguide_id, full_name, party, state, chamber,
+               bills_sponsored, bills_enacted, bills_passed, sponsor_success_rate,
+               total_roll_calls, votes_missed, attendance_rate, party_loyalty_pct,
+               activity_score
+        FROM agg_member_scorecard
+        {where}
+        ORDER BY {sort} DESC NULLS LAST
+        LIMIT $limit OFFSET $offset
+    """
+
+
 _ALLOWED_AGG_TABLES = {
     "agg_congress_summary",
     "agg_policy_breakdown",
@@ -183,16 +193,23 @@ _ALLOWED_AGG_TABLES = {
 }
 
 
-def _query_agg(table: str, model: type, where: str = "", params: list | None = None):
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Validator for a whole list of ``model``, built once per model."""
+    return TypeAdapter(list[model])
+
+
+def _query_agg(table: str, model: type[BaseModel], where: str = "", params: list | None = None):
     """Generic helper to query an aggregate view and return Pydantic models."""
     if table not in _ALLOWED_AGG_TABLES:
         raise ValueError(f"Unknown aggregate table: {table}")
+    # Only the model's columns are fetched, in field order
+    fields = tuple(model.model_fields)
     with get_db() as conn:
         try:
             rows = conn.execute(
-                f"SELECT * FROM {table} {where}", params or []
+                f"SELECT {', '.join(fields)} FROM {table} {where}", params or []
             ).fetchall()
-            columns = [desc[0] for desc in conn.description]
         except Exception as exc:
             logger.exception("Failed to query %s", table)
             raise HTTPException(
@@ -200,4 +217,4 @@ def _query_agg(table: str, model: type, where: str = "", params: list | None = N
                 detail=f"{table} not available — run dbt first",
             ) from exc
 
-    return [model(**dict(zip(columns, row))) for row in rows]
+    return _list_adapter(model).validate_python([dict(zip(fields, r)) for r in rows])
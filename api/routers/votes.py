@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from api.database import PASSAGE_VOTE_FILTER, get_db
+from api.cache import ttl_cache
+from api.database import PASSAGE_VOTE_FILTER, bind_filters, get_db
 
 router = APIRouter()
 
@@ -35,9 +37,10 @@ class Vote(BaseModel):
 
 class VoteList(BaseModel):
     votes: list[Vote]
-    total: int
+    total: int | None = None
     offset: int
     limit: int
+    has_more: bool = False
 
 
 class MemberPosition(BaseModel):
@@ -73,6 +76,7 @@ class VotePositions(BaseModel):
 
 
 @router.get("", response_model=VoteList)
+@ttl_cache(seconds=300)
 def list_votes(
     congress: int | None = Query(None, description="Filter by congress number"),
     chamber: str | None = Query(None, description="Filter by chamber: house, senate"),
@@ -81,55 +85,46 @@ def list_votes(
     passage_only: bool = Query(False, description="Only show passage/substantive votes (exclude procedural)"),
     limit: int = Query(50, ge=1, le=250),
     offset: int = Query(0, ge=0),
+    include_total: bool = Query(False, description="Also count all matches (costs an extra scan)"),
 ):
     """List recent roll call votes.
 
     Use `passage_only=true` to filter out procedural votes and only see
     final passage, conference reports, veto overrides, and other substantive votes.
+    `has_more` tells whether another page follows; `total` is null unless
+    `include_total` is set.
     """
-    with get_db() as conn:
-        conditions: list[str] = []
-        params: list[object] = []
-
-        if congress:
-            conditions.append("congress = ?")
-            params.append(congress)
-        if chamber:
-            conditions.append("chamber = ?")
-            params.append(chamber.lower())
-        if result:
-            conditions.append("result = ?")
-            params.append(result)
-        if bill_id:
-            conditions.append("bill_id = ?")
-            params.append(bill_id)
-        if passage_only:
-            conditions.append(PASSAGE_VOTE_FILTER)
-
-        where = " AND ".join(conditions) if conditions else "1=1"
-
-        total = conn.execute(
-            f"SELECT COUNT(*) FROM votes WHERE {where}", params
-        ).fetchone()[0]
+    filter_params = bind_filters({
+        "congress": congress,
+        "chamber": chamber.lower() if chamber else None,
+        "result": result,
+        "bill_id": bill_id,
+    })
+    page_sql, count_sql = _build_votes_sql(tuple(filter_params), passage_only)
 
+    with get_db() as conn:
         rows = conn.execute(
-            f"""
-            SELECT vote_id, congress, chamber, roll_call, vote_date,
-                   question, description, result, bill_id,
-                   yea_count, nay_count, present_count, not_voting
-            FROM votes
-            WHERE {where}
-            ORDER BY vote_date DESC NULLS LAST
-            LIMIT ? OFFSET ?
-            """,
-            params + [limit, offset],
+            # One extra row tells us whether there is a next page
+            page_sql, {**filter_params, "limit": limit + 1, "offset": offset}
         ).fetchall()
+        total = (
+            conn.execute(count_sql, filter_params).fetchone()[0] if include_total else None
+        )
 
-        votes = [_row_to_vote(r) for r in rows]
-        return VoteList(votes=votes, total=total, offset=offset, limit=limit)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        # Rows map positionally onto Vote; the page is validated in one pass
+        return VoteList.model_validate({
+            "votes": [dict(zip(_VOTE_FIELDS, r)) for r in rows],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "has_more": has_more,
+        })
 
 
 @router.get("/{vote_id}", response_model=Vote)
+@ttl_cache(seconds=300, maxsize=1024)
 def get_vote(vote_id: str):
     """Get a single vote by ID."""
     with get_db() as conn:
@@ -147,10 +142,11 @@ def get_vote(vote_id: str):
         if not row:
             raise HTTPException(status_code=404, detail="Vote not found")
 
-        return _row_to_vote(row)
+        return Vote.model_validate(dict(zip(_VOTE_FIELDS, row)))
 
 
 @router.get("/{vote_id}/positions", response_model=VotePositions)
+@ttl_cache(seconds=300, maxsize=1024)
 def get_vote_positions(
     vote_id: str,
     party: str | None = Query(None, description="Filter by party: D, R, I"),
@@ -161,96 +157,123 @@ def get_vote_positions(
     Returns every member's vote along with a party breakdown summary.
     The party_breakdown shows how many from each party voted Yes/No/Present/Not Voting.
     """
+    params = bind_filters({
+        "vote_id": vote_id,
+        "party": party.upper() if party else None,
+        "position": position,
+    })
+
     with get_db() as conn:
-        # Verify vote exists and get metadata
-        vote_row = conn.execute(
-            "SELECT vote_id, question, result, bill_id FROM votes WHERE vote_id = ?",
-            [vote_id],
+        # Vote metadata, party tally and positions in one round trip over a
+        # single member_votes/members join
+        row = conn.execute(
+            _build_positions_sql(bool(party), bool(position)), params
         ).fetchone()
 
-        if not vote_row:
+        if not row:
             raise HTTPException(status_code=404, detail="Vote not found")
 
-        # Build filters for positions query
-        conditions = ["mv.vote_id = ?"]
-        params: list[object] = [vote_id]
+        positions = row[5] or []
+        return VotePositions.model_validate({
+            "vote_id": row[0],
+            "question": row[1],
+            "result": row[2],
+            "bill_id": row[3],
+            "party_breakdown": row[4] or [],
+            "positions": positions,
+            "total": len(positions),
+        })
 
-        if party:
-            conditions.append("m.party = ?")
-            params.append(party.upper())
-        if position:
-            conditions.append("mv.position = ?")
-            params.append(position)
 
-        where = " AND ".join(conditions)
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
 
-        # Individual positions
-        rows = conn.execute(
-            f"""
-            SELECT mv.bioguide_id, m.full_name, m.party, m.state, mv.position
-            FROM member_votes mv
-            LEFT JOIN members m ON mv.bioguide_id = m.bioguide_id
-            WHERE {where}
-            ORDER BY m.party, m.state, m.last_name
-            """,
-            params,
-        ).fetchall()
 
-        positions = [
-            MemberPosition(
-                bioguide_id=r[0], full_name=r[1], party=r[2],
-                state=r[3], position=r[4],
-            )
-            for r in rows
-        ]
+# Field names in the order the queries select them
+_VOTE_FIELDS = tuple(Vote.model_fields)
 
-        # Party breakdown (always unfiltered to show full picture)
-        tally_rows = conn.execute(
-            """
-            SELECT
-                coalesce(m.party, '?') as party,
-                count(*) filter (where mv.position in ('Yes', 'Yea')) as yes,
-                count(*) filter (where mv.position in ('No', 'Nay')) as no,
-                count(*) filter (where mv.position = 'Present') as present,
-                count(*) filter (where mv.position = 'Not Voting') as not_voting,
-                count(*) as total
-            FROM member_votes mv
-            LEFT JOIN members m ON mv.bioguide_id = m.bioguide_id
-            WHERE mv.vote_id = ?
-            GROUP BY 1
-            ORDER BY total DESC
-            """,
-            [vote_id],
-        ).fetchall()
 
-        party_breakdown = [
-            PartyTally(
-                party=r[0], yes=r[1], no=r[2],
-                present=r[3], not_voting=r[4], total=r[5],
-            )
-            for r in tally_rows
-        ]
-
-        return VotePositions(
-            vote_id=vote_row[0],
-            question=vote_row[1],
-            result=vote_row[2],
-            bill_id=vote_row[3],
-            party_breakdown=party_breakdown,
-            positions=positions,
-            total=len(positions),
-        )
+_VOTE_FILTERS = {
+    "congress": "congress = $congress",
+    "chamber": "chamber = $chamber",
+    "result": "result = $result",
+    "bill_id": "bill_id = $bill_id",
+}
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _build_votes_sql(filters: tuple[str, ...], passage_only: bool) -> tuple[str, str]:
+    """Build (page SQL, count SQL) for one filter combination."""
+    conditions = [_VOTE_FILTERS[f] for f in filters]
+    if passage_only:
+        conditions.append(PASSAGE_VOTE_FILTER)
+    where = " AND ".join(conditions) or "1=1"
+
+    page_sql = f"""
+        SELECT vote_id, congress, chamber, roll_call, vote_date,
+               question, description, result, bill_id,
+               yea_count, nay_count, present_count, not_voting
+        FROM votes
+        WHERE {where}
+        ORDER BY vote_date DESC NULLS LAST
+        LIMIT $limit OFFSET $offset
+    """
+    count_sql = f"SELECT COUNT(*) FROM votes WHERE {where}"
+    return page_sql, count_sql
 
 
-def _row_to_vote(r: tuple) -> Vote:
-    return Vote(
-        vote_id=r[0], congress=r[1], chamber=r[2], roll_call=r[3],
-        vote_date=r[4], question=r[5], description=r[6], result=r[7],
-        bill_id=r[8], yea_count=r[9], nay_count=r[10],
-        present_count=r[11], not_voting=r[12],
-    )
+@lru_cache(maxsize=None)
+def _build_positions_sql(has_party: bool, has_position: bool) -> str:
+    """Build the vote positions SQL for one filter combination.
+
+    The party tally always covers the whole roll call; only the positions
+    list is filtered.
+    """
+    conditions = ["TRUE"]
+    if has_party:
+        conditions.append("party = $party")
+    if has_position:
+        conditions.append("position = $position")
+    where = " AND ".join(conditions)
+
+    return f"""
+        WITH j AS MATERIALIZED (
+            SELECT mv.bioguide_id, m.full_name, m.party, m.state, m.last_name,
+                   mv.position
+            FROM member_votes mv
+            LEFT JOIN members m ON mv.bioguide_id = m.bioguide_id
+            WHERE mv.vote_id = $vote_id
+        ),
+        tally AS (
+            SELECT list({{
+                'party': party, 'yes': yes, 'no': no, 'present': present,
+                'not_voting': not_voting, 'total': total
+            }} ORDER BY total DESC) as party_breakdown
+            FROM (
+                SELECT
+                    coalesce(party, '?') as party,
+                    count(*) filter (where position in ('Yes', 'Yea')) as yes,
+                    count(*) filter (where position in ('No', 'Nay')) as no,
+                    count(*) filter (where position = 'Present') as present,
+                    count(*) filter (where position = 'Not Voting') as not_voting,
+                    count(*) as total
+                FROM j
+                GROUP BY 1
+            )
+        ),
+        positions AS (
+            SELECT list({{
+                'bioguide_id': bioguide_id, 'full_name': full_name,
+                'party': party, 'state': state, 'position': position
+            }} ORDER BY party, state, last_name) as positions
+            FROM j
+            WHERE {where}
+        )
+        SELECT v.vote_id, v.question, v.result, v.bill_id,
+               tally.party_breakdown, positions.positions
+        FROM votes v
+        CROSS JOIN tally
+        CROSS JOIN positions
+        WHERE v.vote_id = $vote_id
+    """
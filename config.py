@@ -1,7 +1,8 @@
-"""Centralized paths for distillgov."""
+"""Centralized paths and settings for distillgov."""
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent
@@ -10,3 +11,12 @@ DB_DIR = ROOT_DIR / "db"
 DB_PATH = DB_DIR / "distillgov.duckdb"
 SCHEMA_PATH = DB_DIR / "schema.sql"
 FACTS_PATH = DB_DIR / "facts.sql"
+
+# DuckDB settings for the API's read-only connection. API queries are short,
+# so a small thread pool avoids per-query spin-up on every core.
+API_DB_THREADS = int(os.getenv("DISTILLGOV_DB_THREADS", "4"))
+API_DB_MEMORY_LIMIT = os.getenv("DISTILLGOV_DB_MEMORY_LIMIT", "2GB")
+
+# Worker threads for the API's sync endpoints. DuckDB releases the GIL while a
+# query runs, so requests mostly wait on the database rather than on Python.
+API_WORKER_THREADS = int(os.getenv("DISTILLGOV_API_WORKER_THREADS", "64"))
@@ -1,6 +1,8 @@
 """Distillgov ETL pipeline DAG.
 
-Daily at 6 AM UTC. All tasks run sequentially (DuckDB single-writer).
+Daily at 6 AM UTC. Tasks run sequentially, except that the senate.gov
+syncs (Senate votes, Senate member votes) run alongside the Congress.gov
+syncs in their group.
 Incremental by default — sync functions track last run via sync_meta.
 
 Hardened for production:
@@ -13,7 +15,6 @@ Hardened for production:
 from __future__ import annotations
 
 import logging
-import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -35,7 +36,7 @@ records updated since the last run.
 #### Data flow
 
 ```
-init_schema → load_zips → [ingest_base] → [ingest_detail] → [enrich] → [dbt] → quality_check
+init_schema → load_zips → [ingest_base] → [ingest_detail] → [enrich] → [dbt] → search_index → quality_check
 ```
 
 | Group | Tasks | Source |
@@ -44,6 +45,7 @@ init_schema → load_zips → [ingest_base] → [ingest_detail] → [enrich] →
 | **ingest_detail** | cosponsors, actions, subjects, summaries, house_member_votes, senate_member_votes | Congress.gov API, senate.gov XML |
 | **enrich** | enrich_members, committees | YAML files, Congress.gov API |
 | **dbt** | run, test | dbt-duckdb |
+| **search_index** | bill full-text index | DuckDB FTS |
 | **quality_check** | data assertions | DuckDB |
 
 #### Parameters
@@ -53,7 +55,13 @@ init_schema → load_zips → [ingest_base] → [ingest_detail] → [enrich] →
 
 #### Notes
 
-- All tasks run **sequentially** — DuckDB only allows one writer at a time.
+- Congress.gov tasks run **sequentially**: they share one API key's
+  5,000 requests/hour budget, so running them side by side would not
+  finish any sooner. The one-slot `congress_api` pool enforces this.
+- `senate_votes` and `senate_member_votes` read senate.gov, so they run
+  alongside the Congress.gov syncs in their groups. Syncs fetch before
+  opening a write connection and wait for DuckDB's single-writer lock, so
+  they take turns writing.
 - `max_active_runs=1` prevents concurrent pipeline executions.
 - Each task has an `execution_timeout` to kill runaways.
 - Quality check runs after dbt and fails the pipeline if data looks wrong.
@@ -96,6 +104,11 @@ _TIMEOUT_MEDIUM = timedelta(minutes=60)    # bills, votes, committees
 _TIMEOUT_LONG = timedelta(hours=3)         # detail syncs (cosponsors, actions, subjects, summaries, member-votes)
 _TIMEOUT_DBT = timedelta(minutes=30)       # dbt run/test
 
+# One slot: Congress.gov tasks share an API key's 5,000 requests/hour, so at
+# most one may run at a time even if tasks are cleared or re-run by hand.
+# Created by airflow-init in docker-compose.yaml.
+CONGRESS_API_POOL = "congress_api"
+
 
 # ---------------------------------------------------------------------------
 # Task callables — lazy imports to avoid import-time DuckDB connections
@@ -103,13 +116,12 @@ _TIMEOUT_DBT = timedelta(minutes=30)       # dbt run/test
 
 
 def _init_schema(**context):
-    import duckdb
-    from config import DB_PATH, SCHEMA_PATH
+    from config import DB_PATH
+    from ingestion.db import apply_schema, get_conn
 
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = duckdb.connect(str(DB_PATH))
-    conn.execute(SCHEMA_PATH.read_text())
-    conn.close()
+    with get_conn() as conn:
+        apply_schema(conn)
 
 
 def _load_zips(**context):
@@ -183,20 +195,35 @@ def _sync_committees(**context):
     sync_committees(congress=context["params"].get("congress", 119))
 
 
+def _dbt(command: str) -> None:
+    """Invoke a dbt command in-process (no interpreter + adapter startup)."""
+    import os
+
+    from dbt.cli.main import dbtRunner
+    from config import DB_PATH
+
+    # profiles.yml falls back to a cwd-relative path; pin it for in-process runs
+    os.environ.setdefault("DISTILLGOV_DB_PATH", str(DB_PATH))
+    result = dbtRunner().invoke([
+        command,
+        "--project-dir", str(DBT_PROJECT_DIR),
+        "--profiles-dir", str(DBT_PROJECT_DIR),
+    ])
+    if not result.success:
+        raise RuntimeError(f"dbt {command} failed") from result.exception
+
+
 def _dbt_run(**context):
-    subprocess.run(
-        ["dbt", "run", "--profiles-dir", "."],
-        cwd=str(DBT_PROJECT_DIR),
-        check=True,
-    )
+    _dbt("run")
 
 
 def _dbt_test(**context):
-    subprocess.run(
-        ["dbt", "test", "--profiles-dir", "."],
-        cwd=str(DBT_PROJECT_DIR),
-        check=True,
-    )
+    _dbt("test")
+
+
+def _build_search_index(**context):
+    from ingestion.search_index import build_search_index
+    build_search_index()
 
 
 def _quality_check(**context):
@@ -228,7 +255,7 @@ with DAG(
         task_id="init_schema",
         python_callable=_init_schema,
         execution_timeout=_TIMEOUT_SHORT,
-        doc_md="Create tables if they don't exist (idempotent).",
+        doc_md="Create tables if they don't exist (idempotent; skipped when schema.sql is unchanged).",
     )
 
     load_zips = PythonOperator(
@@ -242,18 +269,21 @@ with DAG(
         ingest_members = PythonOperator(
             task_id="members",
             python_callable=_sync_members,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_SHORT,
             doc_md="Fetch current members of Congress via bioguide.",
         )
         ingest_bills = PythonOperator(
             task_id="bills",
             python_callable=_sync_bills,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_MEDIUM,
             doc_md="Fetch bills by type. Incremental: only bills updated since last sync.",
         )
         ingest_house_votes = PythonOperator(
             task_id="house_votes",
             python_callable=_sync_votes,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_MEDIUM,
             doc_md="Fetch House roll call votes. Incremental.",
         )
@@ -263,36 +293,42 @@ with DAG(
             execution_timeout=_TIMEOUT_MEDIUM,
             doc_md="Fetch Senate roll call votes from senate.gov XML.",
         )
-        ingest_members >> ingest_bills >> ingest_house_votes >> ingest_senate_votes
+        # Congress.gov syncs share the API rate limit; senate_votes runs alongside
+        ingest_members >> ingest_bills >> ingest_house_votes
 
     with TaskGroup("ingest_detail", tooltip="Detail tables (require base data)") as ingest_detail:
         ingest_cosponsors = PythonOperator(
             task_id="cosponsors",
             python_callable=_sync_cosponsors,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_LONG,
             doc_md="Fetch bill cosponsors + update sponsor_id. Incremental: only changed bills.",
         )
         ingest_actions = PythonOperator(
             task_id="actions",
             python_callable=_sync_actions,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_LONG,
             doc_md="Fetch bill action timelines. Incremental: only changed bills.",
         )
         ingest_subjects = PythonOperator(
             task_id="subjects",
             python_callable=_sync_subjects,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_LONG,
             doc_md="Fetch legislative subject tags. Incremental: only changed bills.",
         )
         ingest_summaries = PythonOperator(
             task_id="summaries",
             python_callable=_sync_summaries,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_LONG,
             doc_md="Fetch CRS summaries and text URLs. Incremental: only changed bills.",
         )
         ingest_house_member_votes = PythonOperator(
             task_id="house_member_votes",
             python_callable=_sync_member_votes,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_LONG,
             doc_md="Fetch individual House member voting positions per roll call.",
         )
@@ -302,13 +338,14 @@ with DAG(
             execution_timeout=_TIMEOUT_LONG,
             doc_md="Fetch individual Senate member voting positions from senate.gov XML.",
         )
+        # Congress.gov syncs share the API rate limit; the senate.gov
+        # sync has no upstream dependency inside the group and runs alongside
         (
             ingest_cosponsors
             >> ingest_actions
             >> ingest_subjects
             >> ingest_summaries
             >> ingest_house_member_votes
-            >> ingest_senate_member_votes
         )
 
     with TaskGroup("enrich", tooltip="Enrich with external data") as enrich_group:
@@ -321,6 +358,7 @@ with DAG(
         ingest_committees = PythonOperator(
             task_id="committees",
             python_callable=_sync_committees,
+            pool=CONGRESS_API_POOL,
             execution_timeout=_TIMEOUT_MEDIUM,
             doc_md="Fetch committees and membership from Congress.gov.",
         )
@@ -341,6 +379,13 @@ with DAG(
         )
         dbt_run >> dbt_test
 
+    search_index = PythonOperator(
+        task_id="search_index",
+        python_callable=_build_search_index,
+        execution_timeout=_TIMEOUT_SHORT,
+        doc_md="Rebuild the bill full-text search index from synced bills and subjects.",
+    )
+
     quality_check = PythonOperator(
         task_id="quality_check",
         python_callable=_quality_check,
@@ -348,5 +393,8 @@ with DAG(
         doc_md="Validate data quality: row counts, null checks, regression detection.",
     )
 
-    # Sequential chain — DuckDB single-writer constraint
-    init_schema >> load_zips >> ingest_base >> ingest_detail >> enrich_group >> dbt_group >> quality_check
+    # Sequential between groups — DuckDB single-writer constraint
+    (
+        init_schema >> load_zips >> ingest_base >> ingest_detail
+        >> enrich_group >> dbt_group >> search_index >> quality_check
+    )
@@ -42,7 +42,9 @@ CREATE TABLE IF NOT EXISTS bills (
     status          TEXT,              -- 'introduced', 'in_committee', 'passed_house', 'passed_senate', 'enacted', 'vetoed'
     summary         TEXT,
     full_text_url   TEXT,
-    updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    title_lower     TEXT,              -- lower(title), for case-insensitive search
+    short_title_lower TEXT             -- lower(short_title)
 );
 
 -- Roll call votes
@@ -62,7 +64,8 @@ CREATE TABLE IF NOT EXISTS votes (
     nay_count       INTEGER,
     present_count   INTEGER,
     not_voting      INTEGER,
-    updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_passage_vote BOOLEAN            -- derived from question at ingest
 );
 
 -- How each member voted on each roll call
@@ -126,7 +129,9 @@ CREATE TABLE IF NOT EXISTS committees (
     chamber         TEXT,
     committee_type  TEXT,              -- 'standing', 'select', 'joint', 'subcommittee'
     parent_id       TEXT,
-    url             TEXT
+    url             TEXT,
+    name_lower      TEXT,              -- lower(name), for case-insensitive search
+    member_count    INTEGER DEFAULT 0  -- rows in committee_members, maintained at ingest
 );
 
 -- Committee membership
@@ -134,6 +139,7 @@ CREATE TABLE IF NOT EXISTS committee_members (
     committee_id    TEXT NOT NULL,
     bioguide_id     TEXT NOT NULL,
     role            TEXT,              -- 'Chair', 'Ranking Member', 'Member'
+    role_rank       TINYINT,           -- roster order: Chair=1, Ranking=2, Vice Chair=3, else 4
     PRIMARY KEY (committee_id, bioguide_id)
 );
 
@@ -141,6 +147,7 @@ CREATE TABLE IF NOT EXISTS committee_members (
 CREATE TABLE IF NOT EXISTS bill_subjects (
     bill_id         TEXT NOT NULL,
     subject         TEXT NOT NULL,
+    subject_lower   TEXT,              -- lower(subject), for case-insensitive search
     PRIMARY KEY (bill_id, subject)
 );
 
@@ -152,6 +159,40 @@ CREATE TABLE IF NOT EXISTS sync_meta (
     record_count    INTEGER DEFAULT 0  -- Records processed in last sync
 );
 
+-- Hash of the schema.sql last applied, so unchanged DDL can be skipped
+CREATE TABLE IF NOT EXISTS schema_meta (
+    schema_hash     TEXT PRIMARY KEY,
+    applied_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Columns added after the initial release (no-ops on fresh databases)
+ALTER TABLE votes ADD COLUMN IF NOT EXISTS is_passage_vote BOOLEAN;
+ALTER TABLE bills ADD COLUMN IF NOT EXISTS title_lower TEXT;
+ALTER TABLE bills ADD COLUMN IF NOT EXISTS short_title_lower TEXT;
+ALTER TABLE bill_subjects ADD COLUMN IF NOT EXISTS subject_lower TEXT;
+ALTER TABLE committees ADD COLUMN IF NOT EXISTS name_lower TEXT;
+ALTER TABLE committees ADD COLUMN IF NOT EXISTS member_count INTEGER DEFAULT 0;
+ALTER TABLE committee_members ADD COLUMN IF NOT EXISTS role_rank TINYINT;
+
+-- Backfill lowered search columns on databases that predate them
+UPDATE bills SET title_lower = lower(title) WHERE title_lower IS NULL AND title IS NOT NULL;
+UPDATE bills SET short_title_lower = lower(short_title) WHERE short_title_lower IS NULL AND short_title IS NOT NULL;
+UPDATE bill_subjects SET subject_lower = lower(subject) WHERE subject_lower IS NULL;
+UPDATE committees SET name_lower = lower(name) WHERE name_lower IS NULL;
+-- Keep in sync with PASSAGE_VOTE_SQL in ingestion/constants.py
+UPDATE votes SET is_passage_vote = coalesce(
+    regexp_matches(question, 'pass|conference report|override|concur|adopt|ratif', 'i'), FALSE
+) WHERE is_passage_vote IS NULL;
+UPDATE committees SET member_count = (
+    SELECT count(*) FROM committee_members cm WHERE cm.committee_id = committees.committee_id
+);
+UPDATE committee_members SET role_rank = CASE role
+    WHEN 'Chair' THEN 1
+    WHEN 'Ranking Member' THEN 2
+    WHEN 'Vice Chair' THEN 3
+    ELSE 4
+END WHERE role_rank IS NULL;
+
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_members_state ON members(state);
 CREATE INDEX IF NOT EXISTS idx_members_chamber ON members(chamber);
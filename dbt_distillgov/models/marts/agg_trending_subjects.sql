@@ -0,0 +1,21 @@
+{{
+    config(materialized='table')
+}}
+
+-- Subject activity for the look-back windows the API serves most often.
+-- Other windows are computed live by the API.
+with windows as (
+    select unnest([7, 30, 90, 365]) as days
+)
+
+select
+    current_date as snapshot_date,
+    w.days,
+    s.subject,
+    count(distinct s.bill_id) as bill_count
+from windows w
+join {{ ref('stg_bills') }} b
+    on b.latest_action_date >= current_date - w.days * interval 1 day
+join {{ ref('stg_bill_subjects') }} s
+    on s.bill_id = b.bill_id
+group by w.days, s.subject
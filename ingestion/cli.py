@@ -5,7 +5,7 @@ from __future__ import annotations
 import typer
 from rich.console import Console
 
-from config import DB_PATH, SCHEMA_PATH, FACTS_PATH
+from config import DB_PATH, FACTS_PATH
 
 app = typer.Typer(help="Distillgov data ingestion CLI")
 console = Console()
@@ -14,16 +14,14 @@ console = Console()
 @app.command()
 def init():
     """Initialize the DuckDB database with schema."""
-    import duckdb
+    from ingestion.db import apply_schema, get_conn
 
     console.print("[bold blue]Initializing database...[/bold blue]")
 
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = duckdb.connect(str(DB_PATH))
-    schema_sql = SCHEMA_PATH.read_text()
-    conn.execute(schema_sql)
-    conn.close()
+    with get_conn() as conn:
+        apply_schema(conn, force=True)
 
     console.print(f"[bold green]Database initialized at {DB_PATH}[/bold green]")
 
@@ -34,7 +32,7 @@ def sync(
         ...,
         help="What to sync: members, bills, cosponsors, actions, subjects, summaries, "
         "votes, member-votes, senate-votes, senate-member-votes, committees, "
-        "enrich-members, load-zips, all",
+        "enrich-members, load-zips, search-index, all",
     ),
     congress: int = typer.Option(118, help="Congress number (e.g., 118 for 118th Congress)"),
     from_congress: int | None = typer.Option(None, help="Sync a range: from this congress up to --congress"),
@@ -56,6 +54,7 @@ def sync(
       committees           - Committee membership from Congress.gov
       enrich-members       - Phone, address, social media from YAML
       load-zips            - Load zip-to-district mappings
+      search-index         - Rebuild the bill full-text search index (requires bills)
       all                  - Full pipeline (all of the above)
 
     Use --from-congress to backfill multiple congresses:
@@ -68,6 +67,7 @@ def sync(
             "members", "enrich-members", "bills", "cosponsors", "actions",
             "subjects", "summaries", "votes", "member-votes",
             "senate-votes", "senate-member-votes", "committees", "load-zips",
+            "search-index",
         ]
     else:
         targets = [target]
@@ -131,6 +131,10 @@ def sync(
                 from ingestion.load_zip_districts import load_zip_districts
                 load_zip_districts()
 
+            elif t == "search-index":
+                from ingestion.search_index import build_search_index
+                build_search_index()
+
             else:
                 console.print(f"[red]Unknown target: {t}[/red]")
                 raise typer.Exit(1)
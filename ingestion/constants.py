@@ -41,8 +41,22 @@ def normalize_state(state: str | None) -> str | None:
     return STATE_CODES.get(state)
 
 
+# Vote questions that decide a measure's fate (passage, overrides, adoption).
+# Evaluated at ingest into votes.is_passage_vote as a single case-insensitive
+# regex ("pass" also covers "passage"). db/schema.sql backfills older rows
+# with a copy of this expression.
+PASSAGE_VOTE_SQL = (
+    "regexp_matches(question, "
+    "'pass|conference report|override|concur|adopt|ratif', 'i')"
+)
+
+
 MAX_CONSECUTIVE_ERRORS = 10
 
+# Items (bills, votes) fetched between writes in the detail syncs. Bounds
+# what a crash, timeout or error abort mid-sync throws away.
+WRITE_CHUNK_SIZE = 500
+
 
 class SyncError(Exception):
     """Raised when too many consecutive API errors indicate a systemic failure."""
@@ -4,20 +4,33 @@ Guarantees:
 - Connections are always closed, even on crash
 - Writes happen in explicit transactions (no half-written state)
 - CHECKPOINT after writes to flush WAL to disk
+- Opening waits for another process's file lock instead of failing, so
+  ingest tasks running side by side take turns writing
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import time
+from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
 from typing import Generator
 
 import duckdb
 
-from config import DB_PATH
+from config import DB_PATH, SCHEMA_PATH
 
 log = logging.getLogger(__name__)
 
+# How long to wait for another process to release the database file lock.
+# Sync functions only hold a connection while writing, so waits are short.
+LOCK_TIMEOUT_SECONDS = 600
+_LOCK_RETRY_SECONDS = 1.0
+
 
 @contextmanager
 def get_conn(read_only: bool = False) -> Generator[duckdb.DuckDBPyConnection, None, None]:
@@ -27,7 +40,7 @@ def get_conn(read_only: bool = False) -> Generator[duckdb.DuckDBPyConnection, No
         with get_conn() as conn:
             conn.execute("INSERT ...")
     """
-    conn = duckdb.connect(str(DB_PATH), read_only=read_only)
+    conn = _connect(read_only)
     try:
         yield conn
     finally:
@@ -39,6 +52,19 @@ def get_conn(read_only: bool = False) -> Generator[duckdb.DuckDBPyConnection, No
         conn.close()
 
 
+def _connect(read_only: bool) -> duckdb.DuckDBPyConnection:
+    """Open the database, retrying while another process holds the lock."""
+    deadline = time.monotonic() + LOCK_TIMEOUT_SECONDS
+    while True:
+        try:
+            return duckdb.connect(str(DB_PATH), read_only=read_only)
+        except duckdb.IOException as e:
+            if "Could not set lock" not in str(e) or time.monotonic() >= deadline:
+                raise
+            log.debug("Database locked by another process; retrying")
+            time.sleep(_LOCK_RETRY_SECONDS)
+
+
 @contextmanager
 def transaction(conn: duckdb.DuckDBPyConnection) -> Generator[None, None, None]:
     """Explicit transaction with rollback on error.
@@ -79,3 +105,93 @@ def batch_execute(
             conn.executemany(sql, batch)
         total += len(batch)
     return total
+
+
+def bulk_insert(
+    conn: duckdb.DuckDBPyConnection,
+    table: str,
+    columns: Sequence[str],
+    rows: list[list],
+    computed: Mapping[str, str] | None = None,
+) -> int:
+    """INSERT OR REPLACE rows into a table in a single statement.
+
+    Tables without a primary key get a plain INSERT.
+
+    Rows are staged as newline-delimited JSON and read back with read_json,
+    which avoids binding every value through executemany (tens of times
+    slower for large loads). ``computed`` maps extra columns to SQL
+    expressions, e.g. ``{"updated_at": "CURRENT_TIMESTAMP"}``; columns not
+    listed keep their current values on replace. As with row-by-row
+    replaces, the last of several rows sharing a primary key wins.
+
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    types = dict(conn.execute(
+        "SELECT column_name, data_type FROM duckdb_columns() "
+        "WHERE database_name = current_database() AND schema_name = 'main' "
+        "AND table_name = ?",
+        [table],
+    ).fetchall())
+    pk = conn.execute(
+        "SELECT constraint_column_names FROM duckdb_constraints() "
+        "WHERE database_name = current_database() AND schema_name = 'main' "
+        "AND table_name = ? AND constraint_type = 'PRIMARY KEY'",
+        [table],
+    ).fetchone()
+    verb = "INSERT"
+    if pk:
+        # One statement keeps the first duplicate; keep the last instead
+        key = [columns.index(c) for c in pk[0]]
+        rows = list({tuple(row[i] for i in key): row for row in rows}.values())
+        verb = "INSERT OR REPLACE"
+
+    computed = computed or {}
+    target = ", ".join([*columns, *computed])
+    select = ", ".join(["*", *computed.values()])
+
+    fd, path = tempfile.mkstemp(suffix=".ndjson")
+    try:
+        with os.fdopen(fd, "w") as f:
+            for row in rows:
+                f.write(json.dumps(dict(zip(columns, row)), default=str))
+                f.write("\n")
+        conn.execute(
+            f"{verb} INTO {table} ({target}) SELECT {select} "
+            "FROM read_json(?, format = 'newline_delimited', columns = ?)",
+            [path, {c: types[c] for c in columns}],
+        )
+    finally:
+        os.unlink(path)
+    return len(rows)
+
+
+def apply_schema(conn: duckdb.DuckDBPyConnection, force: bool = False) -> bool:
+    """Run schema.sql unless this exact version was already applied.
+
+    The DDL is idempotent but its backfill UPDATEs scan whole tables, so
+    the file's hash is recorded in schema_meta and an unchanged schema is
+    skipped. ``force`` runs it regardless, e.g. to recreate dropped tables.
+
+    Returns whether the DDL ran.
+    """
+    schema_sql = SCHEMA_PATH.read_text()
+    schema_hash = hashlib.blake2b(schema_sql.encode(), digest_size=16).hexdigest()
+
+    if not force:
+        try:
+            row = conn.execute("SELECT schema_hash FROM schema_meta").fetchone()
+        except duckdb.CatalogException:
+            row = None  # Database predates schema_meta
+        if row and row[0] == schema_hash:
+            log.debug("Schema unchanged (%s); skipping DDL", schema_hash)
+            return False
+
+    conn.execute(schema_sql)
+    with transaction(conn):
+        conn.execute("DELETE FROM schema_meta")
+        conn.execute("INSERT INTO schema_meta (schema_hash) VALUES (?)", [schema_hash])
+    return True
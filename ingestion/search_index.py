@@ -0,0 +1,43 @@
+"""Build the full-text search index behind the bills `q` filter."""
+
+from __future__ import annotations
+
+import logging
+
+from ingestion.db import get_conn
+from ingestion.sync_meta import set_last_sync
+
+log = logging.getLogger(__name__)
+
+
+def build_search_index():
+    """Rebuild bill_search and its FTS index from bills and bill_subjects.
+
+    DuckDB FTS indexes are static snapshots, so this must be re-run after
+    bills, cosponsors (short titles) or subjects are synced. The build is
+    recorded in sync_meta; until it has run, or once a later sync makes it
+    stale, the API falls back to substring search.
+    """
+    with get_conn() as conn:
+        conn.execute("INSTALL fts")
+        conn.execute("LOAD fts")
+
+        # One document per bill: titles plus all of its subject tags
+        conn.execute(
+            """
+            CREATE OR REPLACE TABLE bill_search AS
+            SELECT b.bill_id, b.title, b.short_title,
+                   string_agg(bs.subject, ' ') AS subjects
+            FROM bills b
+            LEFT JOIN bill_subjects bs ON b.bill_id = bs.bill_id
+            GROUP BY b.bill_id, b.title, b.short_title
+            """
+        )
+        conn.execute(
+            "PRAGMA create_fts_index('bill_search', 'bill_id', "
+            "'title', 'short_title', 'subjects', overwrite = 1)"
+        )
+        count = conn.execute("SELECT count(*) FROM bill_search").fetchone()[0]
+
+    set_last_sync("search-index", count)
+    log.info("Indexed %d bills for search", count)
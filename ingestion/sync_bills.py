@@ -8,8 +8,8 @@ import re
 from rich.progress import track
 
 from ingestion.client import CongressClient
-from ingestion.constants import check_consecutive_errors
-from ingestion.db import get_conn
+from ingestion.constants import WRITE_CHUNK_SIZE, check_consecutive_errors
+from ingestion.db import batch_execute, bulk_insert, get_conn
 from ingestion.sync_meta import get_last_sync, set_last_sync
 
 log = logging.getLogger(__name__)
@@ -20,7 +20,6 @@ BILL_TYPES = ["hr", "s", "hjres", "sjres", "hconres", "sconres", "hres", "sres"]
 def sync_bills(
     congress: int = 118,
     bill_types: list[str] | None = None,
-    with_details: bool = False,
     full: bool = False,
 ):
     """Sync bills from a Congress into DuckDB.
@@ -62,124 +61,72 @@ def sync_bills(
 
         log.info("Fetched %d bills", len(bills))
 
+    # Load in date order so the appended row groups stay clustered on
+    # latest_action_date and date-range scans can skip them via zone maps
+    bills.sort(key=lambda b: (b.get("latestAction") or {}).get("actionDate") or "")
+
+    rows = []
+    for bill in track(bills, description="Loading bills..."):
+        bill_type = bill.get("type", "").lower()
+        bill_number = bill.get("number")
+
+        if not bill_number:
+            continue
+
+        bill_id = f"{congress}-{bill_type}-{bill_number}"
+
+        latest_action = bill.get("latestAction", {})
+        latest_action_text = latest_action.get("text")
+        latest_action_date = latest_action.get("actionDate")
+        status = determine_status(latest_action_text)
+        policy_area = bill.get("policyArea", {}).get("name") if bill.get("policyArea") else None
+        title = bill.get("title")
+
+        rows.append([
+            bill_id, congress, bill_type, bill_number,
+            title, bill.get("introducedDate"),
+            bill.get("originChamber"), latest_action_text,
+            latest_action_date, status, policy_area,
+            title.lower() if title else None,
+        ])
+
     with get_conn() as conn:
-        inserted = 0
-        for bill in track(bills, description="Loading bills..."):
-            bill_type = bill.get("type", "").lower()
-            bill_number = bill.get("number")
-
-            if not bill_number:
-                continue
-
-            bill_id = f"{congress}-{bill_type}-{bill_number}"
-
-            latest_action = bill.get("latestAction", {})
-            latest_action_text = latest_action.get("text")
-            latest_action_date = latest_action.get("actionDate")
-            status = determine_status(latest_action_text)
-            policy_area = bill.get("policyArea", {}).get("name") if bill.get("policyArea") else None
-
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO bills (
-                    bill_id, congress, bill_type, bill_number,
-                    title, introduced_date, origin_chamber,
-                    latest_action, latest_action_date, status,
-                    policy_area, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                [
-                    bill_id, congress, bill_type, bill_number,
-                    bill.get("title"), bill.get("introducedDate"),
-                    bill.get("originChamber"), latest_action_text,
-                    latest_action_date, status, policy_area,
-                ],
-            )
-            inserted += 1
+        inserted = bulk_insert(
+            conn,
+            "bills",
+            (
+                "bill_id", "congress", "bill_type", "bill_number",
+                "title", "introduced_date", "origin_chamber",
+                "latest_action", "latest_action_date", "status",
+                "policy_area", "title_lower",
+            ),
+            rows,
+            {"updated_at": "CURRENT_TIMESTAMP"},
+        )
 
     log.info("Inserted %d bills", inserted)
     set_last_sync(f"bills-{congress}", inserted)
 
-    if with_details:
-        sync_bill_details(congress, bills)
-
-
-def sync_bill_details(congress: int, bills: list[dict]):
-    """Sync cosponsors and actions for bills."""
-    log.info("Fetching cosponsors and actions for %d bills", len(bills))
-
-    cosponsors_inserted = 0
-    actions_inserted = 0
-    sponsors_updated = 0
-
-    with get_conn() as conn, CongressClient() as client:
-        for bill in track(bills, description="Fetching bill details..."):
-            bill_type = bill.get("type", "").lower()
-            bill_number = bill.get("number")
-
-            if not bill_number:
-                continue
-
-            bill_id = f"{congress}-{bill_type}-{bill_number}"
-
-            try:
-                detail = client.get_bill(congress, bill_type, bill_number)
-                bill_data = detail.get("bill", {})
-
-                sponsors = bill_data.get("sponsors", [])
-                if sponsors:
-                    sponsor_id = sponsors[0].get("bioguideId")
-                    if sponsor_id:
-                        conn.execute(
-                            "UPDATE bills SET sponsor_id = ? WHERE bill_id = ?",
-                            [sponsor_id, bill_id],
-                        )
-                        sponsors_updated += 1
-
-                cosponsors_response = client.get_bill_cosponsors(congress, bill_type, bill_number)
-                for cosponsor in cosponsors_response.get("cosponsors", []):
-                    bioguide_id = cosponsor.get("bioguideId")
-                    if not bioguide_id:
-                        continue
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO bill_cosponsors (
-                            bill_id, bioguide_id, cosponsor_date, is_original
-                        ) VALUES (?, ?, ?, ?)
-                        """,
-                        [bill_id, bioguide_id, cosponsor.get("sponsorshipDate"),
-                         cosponsor.get("isOriginalCosponsor", False)],
-                    )
-                    cosponsors_inserted += 1
-
-                actions_response = client.get_bill_actions(congress, bill_type, bill_number)
-                for idx, action in enumerate(actions_response.get("actions", [])):
-                    action_code = action.get("actionCode", "")
-                    if action_code.startswith("H"):
-                        chamber = "house"
-                    elif action_code.startswith("S"):
-                        chamber = "senate"
-                    else:
-                        chamber = None
-
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO bill_actions (
-                            bill_id, action_date, action_text, action_type, chamber, sequence
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        [bill_id, action.get("actionDate"), action.get("text"),
-                         action.get("type"), chamber, idx],
-                    )
-                    actions_inserted += 1
-
-            except Exception as e:
-                log.debug("  %s: %s", bill_id, e)
-                continue
-
-    log.info("Updated %d sponsors", sponsors_updated)
-    log.info("Inserted %d cosponsors", cosponsors_inserted)
-    log.info("Inserted %d actions", actions_inserted)
+
+def _bills_to_sync(congress: int, from_dt: str | None) -> list[tuple]:
+    """(bill_id, bill_type, bill_number) for bills updated since ``from_dt``."""
+    with get_conn(read_only=True) as conn:
+        if from_dt:
+            log.info("  Incremental: only bills updated since %s", from_dt)
+            return conn.execute(
+                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ? AND updated_at >= ?",
+                [congress, from_dt],
+            ).fetchall()
+        return conn.execute(
+            "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ?",
+            [congress],
+        ).fetchall()
+
+
+# The detail syncs below buffer WRITE_CHUNK_SIZE bills at a time and write
+# each chunk under a short-lived connection, so other ingest tasks can write
+# while these wait on the API. Whatever is buffered is also written when a
+# sync fails, so a retry only loses the bill that was in flight.
 
 
 def sync_cosponsors(congress: int = 118, full: bool = False):
@@ -190,31 +137,49 @@ def sync_cosponsors(congress: int = 118, full: bool = False):
     log.info("Syncing cosponsors for Congress %d", congress)
 
     from_dt = None if full else get_last_sync(f"cosponsors-{congress}")
-
-    with get_conn() as conn:
-        if from_dt:
-            log.info("  Incremental: only bills updated since %s", from_dt)
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ? AND updated_at >= ?",
-                [congress, from_dt],
-            ).fetchall()
-        else:
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ?",
-                [congress],
-            ).fetchall()
-
-        if not bills:
-            log.warning("No bills found. Run 'sync bills' first.")
+    bills = _bills_to_sync(congress, from_dt)
+
+    if not bills:
+        log.warning("No bills found. Run 'sync bills' first.")
+        return
+
+    log.info("Found %d bills", len(bills))
+    sponsor_rows: list[list] = []
+    short_title_rows: list[list] = []
+    cosponsor_rows: list[list] = []
+    sponsors_updated = inserted = 0
+    consecutive_errors = 0
+
+    def flush() -> None:
+        nonlocal sponsors_updated, inserted
+        if not (sponsor_rows or short_title_rows or cosponsor_rows):
             return
+        with get_conn() as conn:
+            sponsors_updated += batch_execute(
+                conn, "UPDATE bills SET sponsor_id = ? WHERE bill_id = ?", sponsor_rows,
+            )
+            batch_execute(
+                conn,
+                "UPDATE bills SET short_title = ?, short_title_lower = ? WHERE bill_id = ?",
+                short_title_rows,
+            )
+            inserted += bulk_insert(
+                conn,
+                "bill_cosponsors",
+                ("bill_id", "bioguide_id", "cosponsor_date", "is_original"),
+                cosponsor_rows,
+            )
+        sponsor_rows.clear()
+        short_title_rows.clear()
+        cosponsor_rows.clear()
 
-        log.info("Found %d bills", len(bills))
-        inserted = 0
-        sponsors_updated = 0
-        consecutive_errors = 0
-
-        with CongressClient() as client:
-            for bill_id, bill_type, bill_number in track(bills, description="Fetching cosponsors..."):
+    with CongressClient() as client:
+        try:
+            for i, (bill_id, bill_type, bill_number) in enumerate(
+                track(bills, description="Fetching cosponsors...")
+            ):
+                if i and i % WRITE_CHUNK_SIZE == 0:
+                    flush()
                 try:
                     detail = client.get_bill(congress, bill_type, bill_number)
                     bill_data = detail.get("bill", {})
@@ -223,21 +188,14 @@ def sync_cosponsors(congress: int = 118, full: bool = False):
                     if sponsors:
                         sponsor_id = sponsors[0].get("bioguideId")
                         if sponsor_id:
-                            conn.execute(
-                                "UPDATE bills SET sponsor_id = ? WHERE bill_id = ?",
-                                [sponsor_id, bill_id],
-                            )
-                            sponsors_updated += 1
+                            sponsor_rows.append([sponsor_id, bill_id])
 
                     titles = bill_data.get("titles", [])
                     for t in titles:
                         if t.get("titleType", "").startswith("Short Title"):
                             short = t.get("title")
                             if short:
-                                conn.execute(
-                                    "UPDATE bills SET short_title = ? WHERE bill_id = ?",
-                                    [short, bill_id],
-                                )
+                                short_title_rows.append([short, short.lower(), bill_id])
                                 break
 
                     response = client.get_bill_cosponsors(congress, bill_type, bill_number)
@@ -245,16 +203,10 @@ def sync_cosponsors(congress: int = 118, full: bool = False):
                         bioguide_id = cosponsor.get("bioguideId")
                         if not bioguide_id:
                             continue
-                        conn.execute(
-                            """
-                            INSERT OR REPLACE INTO bill_cosponsors (
-                                bill_id, bioguide_id, cosponsor_date, is_original
-                            ) VALUES (?, ?, ?, ?)
-                            """,
-                            [bill_id, bioguide_id, cosponsor.get("sponsorshipDate"),
-                             cosponsor.get("isOriginalCosponsor", False)],
-                        )
-                        inserted += 1
+                        cosponsor_rows.append([
+                            bill_id, bioguide_id, cosponsor.get("sponsorshipDate"),
+                            cosponsor.get("isOriginalCosponsor", False),
+                        ])
 
                     consecutive_errors = 0
                 except Exception as e:
@@ -262,6 +214,8 @@ def sync_cosponsors(congress: int = 118, full: bool = False):
                     log.debug("  %s: %s", bill_id, e)
                     check_consecutive_errors(consecutive_errors, e)
                     continue
+        finally:
+            flush()
 
     log.info("Updated %d bill sponsors", sponsors_updated)
     log.info("Inserted %d cosponsors", inserted)
@@ -276,30 +230,37 @@ def sync_actions(congress: int = 118, full: bool = False):
     log.info("Syncing bill actions for Congress %d", congress)
 
     from_dt = None if full else get_last_sync(f"actions-{congress}")
+    bills = _bills_to_sync(congress, from_dt)
 
-    with get_conn() as conn:
-        if from_dt:
-            log.info("  Incremental: only bills updated since %s", from_dt)
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ? AND updated_at >= ?",
-                [congress, from_dt],
-            ).fetchall()
-        else:
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ?",
-                [congress],
-            ).fetchall()
+    if not bills:
+        log.warning("No bills found. Run 'sync bills' first.")
+        return
 
-        if not bills:
-            log.warning("No bills found. Run 'sync bills' first.")
-            return
+    log.info("Found %d bills", len(bills))
+    rows: list[list] = []
+    inserted = 0
+    consecutive_errors = 0
 
-        log.info("Found %d bills", len(bills))
-        inserted = 0
-        consecutive_errors = 0
+    def flush() -> None:
+        nonlocal inserted
+        if not rows:
+            return
+        with get_conn() as conn:
+            inserted += bulk_insert(
+                conn,
+                "bill_actions",
+                ("bill_id", "action_date", "action_text", "action_type", "chamber", "sequence"),
+                rows,
+            )
+        rows.clear()
 
-        with CongressClient() as client:
-            for bill_id, bill_type, bill_number in track(bills, description="Fetching actions..."):
+    with CongressClient() as client:
+        try:
+            for i, (bill_id, bill_type, bill_number) in enumerate(
+                track(bills, description="Fetching actions...")
+            ):
+                if i and i % WRITE_CHUNK_SIZE == 0:
+                    flush()
                 try:
                     response = client.get_bill_actions(congress, bill_type, bill_number)
                     for idx, action in enumerate(response.get("actions", [])):
@@ -311,16 +272,10 @@ def sync_actions(congress: int = 118, full: bool = False):
                         else:
                             chamber = None
 
-                        conn.execute(
-                            """
-                            INSERT OR REPLACE INTO bill_actions (
-                                bill_id, action_date, action_text, action_type, chamber, sequence
-                            ) VALUES (?, ?, ?, ?, ?, ?)
-                            """,
-                            [bill_id, action.get("actionDate"), action.get("text"),
-                             action.get("type"), chamber, idx],
-                        )
-                        inserted += 1
+                        rows.append([
+                            bill_id, action.get("actionDate"), action.get("text"),
+                            action.get("type"), chamber, idx,
+                        ])
 
                     consecutive_errors = 0
                 except Exception as e:
@@ -328,6 +283,8 @@ def sync_actions(congress: int = 118, full: bool = False):
                     log.debug("  %s: %s", bill_id, e)
                     check_consecutive_errors(consecutive_errors, e)
                     continue
+        finally:
+            flush()
 
     log.info("Inserted %d actions", inserted)
     set_last_sync(f"actions-{congress}", inserted)
@@ -341,30 +298,41 @@ def sync_subjects(congress: int = 118, full: bool = False):
     log.info("Syncing bill subjects for Congress %d", congress)
 
     from_dt = None if full else get_last_sync(f"subjects-{congress}")
+    bills = _bills_to_sync(congress, from_dt)
 
-    with get_conn() as conn:
-        if from_dt:
-            log.info("  Incremental: only bills updated since %s", from_dt)
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ? AND updated_at >= ?",
-                [congress, from_dt],
-            ).fetchall()
-        else:
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ?",
-                [congress],
-            ).fetchall()
+    if not bills:
+        log.warning("No bills found. Run 'sync bills' first.")
+        return
 
-        if not bills:
-            log.warning("No bills found. Run 'sync bills' first.")
-            return
+    log.info("Found %d bills", len(bills))
+    subject_rows: list[list] = []
+    policy_rows: list[list] = []
+    inserted = 0
+    consecutive_errors = 0
 
-        log.info("Found %d bills", len(bills))
-        inserted = 0
-        consecutive_errors = 0
+    def flush() -> None:
+        nonlocal inserted
+        if not (subject_rows or policy_rows):
+            return
+        with get_conn() as conn:
+            inserted += bulk_insert(
+                conn, "bill_subjects", ("bill_id", "subject", "subject_lower"), subject_rows,
+            )
+            batch_execute(
+                conn,
+                "UPDATE bills SET policy_area = ? WHERE bill_id = ? AND policy_area IS NULL",
+                policy_rows,
+            )
+        subject_rows.clear()
+        policy_rows.clear()
 
-        with CongressClient() as client:
-            for bill_id, bill_type, bill_number in track(bills, description="Fetching subjects..."):
+    with CongressClient() as client:
+        try:
+            for i, (bill_id, bill_type, bill_number) in enumerate(
+                track(bills, description="Fetching subjects...")
+            ):
+                if i and i % WRITE_CHUNK_SIZE == 0:
+                    flush()
                 try:
                     response = client.get_bill_subjects(congress, bill_type, bill_number)
                     subjects = response.get("subjects", {})
@@ -372,18 +340,11 @@ def sync_subjects(congress: int = 118, full: bool = False):
                     for subj in subjects.get("legislativeSubjects", []):
                         name = subj.get("name")
                         if name:
-                            conn.execute(
-                                "INSERT OR REPLACE INTO bill_subjects (bill_id, subject) VALUES (?, ?)",
-                                [bill_id, name],
-                            )
-                            inserted += 1
+                            subject_rows.append([bill_id, name, name.lower()])
 
                     policy = subjects.get("policyArea", {})
                     if policy and policy.get("name"):
-                        conn.execute(
-                            "UPDATE bills SET policy_area = ? WHERE bill_id = ? AND policy_area IS NULL",
-                            [policy["name"], bill_id],
-                        )
+                        policy_rows.append([policy["name"], bill_id])
 
                     consecutive_errors = 0
                 except Exception as e:
@@ -391,6 +352,8 @@ def sync_subjects(congress: int = 118, full: bool = False):
                     log.debug("  %s: %s", bill_id, e)
                     check_consecutive_errors(consecutive_errors, e)
                     continue
+        finally:
+            flush()
 
     log.info("Inserted %d subject tags", inserted)
     set_last_sync(f"subjects-{congress}", inserted)
@@ -404,31 +367,39 @@ def sync_summaries(congress: int = 118, full: bool = False):
     log.info("Syncing bill summaries for Congress %d", congress)
 
     from_dt = None if full else get_last_sync(f"summaries-{congress}")
+    bills = _bills_to_sync(congress, from_dt)
 
-    with get_conn() as conn:
-        if from_dt:
-            log.info("  Incremental: only bills updated since %s", from_dt)
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ? AND updated_at >= ?",
-                [congress, from_dt],
-            ).fetchall()
-        else:
-            bills = conn.execute(
-                "SELECT bill_id, bill_type, bill_number FROM bills WHERE congress = ?",
-                [congress],
-            ).fetchall()
+    if not bills:
+        log.warning("No bills found. Run 'sync bills' first.")
+        return
 
-        if not bills:
-            log.warning("No bills found. Run 'sync bills' first.")
-            return
+    log.info("Found %d bills", len(bills))
+    summary_rows: list[list] = []
+    text_rows: list[list] = []
+    summaries_updated = text_updated = 0
+    consecutive_errors = 0
 
-        log.info("Found %d bills", len(bills))
-        summaries_updated = 0
-        text_updated = 0
-        consecutive_errors = 0
+    def flush() -> None:
+        nonlocal summaries_updated, text_updated
+        if not (summary_rows or text_rows):
+            return
+        with get_conn() as conn:
+            summaries_updated += batch_execute(
+                conn, "UPDATE bills SET summary = ? WHERE bill_id = ?", summary_rows,
+            )
+            text_updated += batch_execute(
+                conn, "UPDATE bills SET full_text_url = ? WHERE bill_id = ?", text_rows,
+            )
+        summary_rows.clear()
+        text_rows.clear()
 
-        with CongressClient() as client:
-            for bill_id, bill_type, bill_number in track(bills, description="Fetching summaries..."):
+    with CongressClient() as client:
+        try:
+            for i, (bill_id, bill_type, bill_number) in enumerate(
+                track(bills, description="Fetching summaries...")
+            ):
+                if i and i % WRITE_CHUNK_SIZE == 0:
+                    flush()
                 try:
                     sum_response = client.get_bill_summaries(congress, bill_type, bill_number)
                     summaries = sum_response.get("summaries", [])
@@ -437,11 +408,7 @@ def sync_summaries(congress: int = 118, full: bool = False):
                         text = latest.get("text", "")
                         if text:
                             clean = re.sub(r"<[^>]+>", "", text).strip()
-                            conn.execute(
-                                "UPDATE bills SET summary = ? WHERE bill_id = ?",
-                                [clean, bill_id],
-                            )
-                            summaries_updated += 1
+                            summary_rows.append([clean, bill_id])
 
                     text_response = client.get_bill_text(congress, bill_type, bill_number)
                     versions = text_response.get("textVersions", [])
@@ -459,11 +426,7 @@ def sync_summaries(congress: int = 118, full: bool = False):
                                     url = fmt.get("url")
                                     break
                         if url:
-                            conn.execute(
-                                "UPDATE bills SET full_text_url = ? WHERE bill_id = ?",
-                                [url, bill_id],
-                            )
-                            text_updated += 1
+                            text_rows.append([url, bill_id])
 
                     consecutive_errors = 0
                 except Exception as e:
@@ -471,6 +434,8 @@ def sync_summaries(congress: int = 118, full: bool = False):
                     log.debug("  %s: %s", bill_id, e)
                     check_consecutive_errors(consecutive_errors, e)
                     continue
+        finally:
+            flush()
 
     log.info("Updated %d summaries, %d text URLs", summaries_updated, text_updated)
     set_last_sync(f"summaries-{congress}", summaries_updated + text_updated)
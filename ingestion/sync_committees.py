@@ -5,10 +5,13 @@ from __future__ import annotations
 import logging
 
 from ingestion.client import CongressClient
-from ingestion.db import get_conn
+from ingestion.db import bulk_insert, get_conn
 
 log = logging.getLogger(__name__)
 
+# Roster order for committee_members.role_rank; any other role ranks last
+ROLE_RANKS = {"Chair": 1, "Ranking Member": 2, "Vice Chair": 3}
+
 
 def sync_committees(congress: int = 118):
     """Sync committees and their members from Congress.gov.
@@ -39,61 +42,70 @@ def sync_committees(congress: int = 118):
         if not committees:
             return
 
-        with get_conn() as conn:
-            committees_inserted = 0
-            members_inserted = 0
-
-            for committee in committees:
-                name = committee.get("name", "")
-                chamber = committee.get("chamber", "")
-                committee_type = committee.get("committeeTypeCode", "")
-                parent = committee.get("parent")
-                parent_id = parent.get("systemCode") if parent else None
-                url = committee.get("url")
-
-                system_code = committee.get("systemCode", "")
-                if not system_code:
-                    continue
-
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO committees (
-                        committee_id, name, chamber, committee_type, parent_id, url
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    [system_code, name, chamber.lower() if chamber else None,
-                     committee_type, parent_id, url]
-                )
-                committees_inserted += 1
-
-                try:
-                    chamber_code = chamber.lower() if chamber else "house"
-                    detail = client.get_committee(congress, chamber_code, system_code)
-                    committee_data = detail.get("committee", {})
-
-                    current_members = committee_data.get("currentMembers", [])
-                    if not current_members:
-                        current_members = committee_data.get("members", [])
-
-                    for member in current_members:
-                        bioguide_id = member.get("bioguideId")
-                        if not bioguide_id:
-                            continue
-
-                        role = member.get("role") or "Member"
-
-                        conn.execute(
-                            """
-                            INSERT OR REPLACE INTO committee_members (
-                                committee_id, bioguide_id, role
-                            ) VALUES (?, ?, ?)
-                            """,
-                            [system_code, bioguide_id, role]
-                        )
-                        members_inserted += 1
-
-                except Exception as e:
-                    log.debug("  %s: %s", system_code, e)
-                    continue
-
-            log.info("Inserted %d committees, %d memberships", committees_inserted, members_inserted)
+        committee_rows: list[list] = []
+        member_rows: list[list] = []
+
+        for committee in committees:
+            name = committee.get("name", "")
+            chamber = committee.get("chamber", "")
+            committee_type = committee.get("committeeTypeCode", "")
+            parent = committee.get("parent")
+            parent_id = parent.get("systemCode") if parent else None
+            url = committee.get("url")
+
+            system_code = committee.get("systemCode", "")
+            if not system_code:
+                continue
+
+            committee_rows.append([
+                system_code, name, chamber.lower() if chamber else None,
+                committee_type, parent_id, url, name.lower(),
+            ])
+
+            try:
+                chamber_code = chamber.lower() if chamber else "house"
+                detail = client.get_committee(congress, chamber_code, system_code)
+                committee_data = detail.get("committee", {})
+
+                current_members = committee_data.get("currentMembers", [])
+                if not current_members:
+                    current_members = committee_data.get("members", [])
+
+                for member in current_members:
+                    bioguide_id = member.get("bioguideId")
+                    if not bioguide_id:
+                        continue
+
+                    role = member.get("role") or "Member"
+                    member_rows.append([system_code, bioguide_id, role, ROLE_RANKS.get(role, 4)])
+
+            except Exception as e:
+                log.debug("  %s: %s", system_code, e)
+                continue
+
+    # Rosters are written only after every fetch, so the write lock is held briefly
+    with get_conn() as conn:
+        committees_inserted = bulk_insert(
+            conn,
+            "committees",
+            ("committee_id", "name", "chamber", "committee_type", "parent_id", "url", "name_lower"),
+            committee_rows,
+        )
+        members_inserted = bulk_insert(
+            conn,
+            "committee_members",
+            ("committee_id", "bioguide_id", "role", "role_rank"),
+            member_rows,
+        )
+
+        # Denormalized so the committee list needs no GROUP BY per request
+        conn.execute(
+            """
+            UPDATE committees SET member_count = (
+                SELECT count(*) FROM committee_members cm
+                WHERE cm.committee_id = committees.committee_id
+            )
+            """
+        )
+
+    log.info("Inserted %d committees, %d memberships", committees_inserted, members_inserted)
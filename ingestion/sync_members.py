@@ -8,18 +8,16 @@ from rich.progress import track
 
 from ingestion.client import CongressClient
 from ingestion.constants import normalize_state
-from ingestion.db import batch_execute, get_conn
+from ingestion.db import bulk_insert, get_conn
 from ingestion.sync_meta import set_last_sync
 
 log = logging.getLogger(__name__)
 
-INSERT_SQL = """
-    INSERT OR REPLACE INTO members (
-        bioguide_id, first_name, last_name, full_name,
-        party, state, district, chamber, is_current,
-        image_url, official_url, updated_at
-    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-"""
+INSERT_COLUMNS = (
+    "bioguide_id", "first_name", "last_name", "full_name",
+    "party", "state", "district", "chamber", "is_current",
+    "image_url", "official_url",
+)
 
 
 def _transform_member(member: dict) -> list | None:
@@ -101,7 +99,9 @@ def sync_members(congress: int = 118):
             rows.append(row)
 
     with get_conn() as conn:
-        inserted = batch_execute(conn, INSERT_SQL, rows)
+        inserted = bulk_insert(
+            conn, "members", INSERT_COLUMNS, rows, {"updated_at": "CURRENT_TIMESTAMP"},
+        )
 
     log.info("Inserted %d members", inserted)
     set_last_sync("members", inserted)
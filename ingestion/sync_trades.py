@@ -13,6 +13,7 @@ from capitolgains.utils.senator_scraper import SenateDisclosureScraper
 
 from config import DB_PATH
 from ingestion.constants import normalize_state
+from ingestion.db import bulk_insert
 
 console = Console()
 
@@ -23,6 +24,17 @@ def generate_trade_id(bioguide_id: str, pdf_url: str) -> str:
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
+def _insert_trades(conn: duckdb.DuckDBPyConnection, rows: list[list]) -> int:
+    """Write collected filings in one statement."""
+    return bulk_insert(
+        conn,
+        "trades",
+        ("trade_id", "bioguide_id", "asset_name", "trade_type", "ptr_link", "comment"),
+        rows,
+        {"updated_at": "CURRENT_TIMESTAMP"},
+    )
+
+
 def sync_house_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
     """Sync House member trades (PTR filings)."""
     console.print(f"[blue]Syncing House disclosures for {year}...[/blue]")
@@ -35,7 +47,7 @@ def sync_house_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
         console.print("[yellow]No House members found. Run 'sync members' first.[/yellow]")
         return 0
 
-    inserted = 0
+    rows: list[list] = []
     checked = 0
 
     with HouseDisclosureScraper() as scraper:
@@ -61,23 +73,14 @@ def sync_house_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
                     trade_id = generate_trade_id(bioguide_id, pdf_url)
                     filing_type = filing.get("filing_type", "ptr")
 
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO trades (
-                            trade_id, bioguide_id, asset_name, trade_type,
-                            ptr_link, comment, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """,
-                        [
-                            trade_id,
-                            bioguide_id,
-                            f"PTR Filing - {filing_type}",
-                            "disclosure",
-                            pdf_url,
-                            f"Year: {filing.get('year')}",
-                        ],
-                    )
-                    inserted += 1
+                    rows.append([
+                        trade_id,
+                        bioguide_id,
+                        f"PTR Filing - {filing_type}",
+                        "disclosure",
+                        pdf_url,
+                        f"Year: {filing.get('year')}",
+                    ])
 
             except Exception as e:
                 # Silently skip members without disclosures
@@ -86,7 +89,7 @@ def sync_house_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
                 continue
 
     console.print(f"  Checked {checked} House members")
-    return inserted
+    return _insert_trades(conn, rows)
 
 
 def sync_senate_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
@@ -101,7 +104,7 @@ def sync_senate_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
         console.print("[yellow]No Senators found. Run 'sync members' first.[/yellow]")
         return 0
 
-    inserted = 0
+    rows: list[list] = []
     checked = 0
 
     with SenateDisclosureScraper() as scraper:
@@ -126,23 +129,14 @@ def sync_senate_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
                     trade_id = generate_trade_id(bioguide_id, pdf_url)
                     filing_type = filing.get("filing_type", "ptr")
 
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO trades (
-                            trade_id, bioguide_id, asset_name, trade_type,
-                            ptr_link, comment, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        """,
-                        [
-                            trade_id,
-                            bioguide_id,
-                            f"PTR Filing - {filing_type}",
-                            "disclosure",
-                            pdf_url,
-                            f"Year: {filing.get('year')}",
-                        ],
-                    )
-                    inserted += 1
+                    rows.append([
+                        trade_id,
+                        bioguide_id,
+                        f"PTR Filing - {filing_type}",
+                        "disclosure",
+                        pdf_url,
+                        f"Year: {filing.get('year')}",
+                    ])
 
             except Exception as e:
                 if "No disclosure" not in str(e) and "not found" not in str(e).lower():
@@ -150,7 +144,7 @@ def sync_senate_trades(year: int, conn: duckdb.DuckDBPyConnection) -> int:
                 continue
 
     console.print(f"  Checked {checked} Senators")
-    return inserted
+    return _insert_trades(conn, rows)
 
 
 def sync_trades(year: int = 2024):
@@ -10,8 +10,8 @@ from pathlib import Path
 from rich.progress import track
 
 from ingestion.client import CongressClient
-from ingestion.constants import check_consecutive_errors
-from ingestion.db import get_conn
+from ingestion.constants import PASSAGE_VOTE_SQL, WRITE_CHUNK_SIZE, check_consecutive_errors
+from ingestion.db import bulk_insert, get_conn
 from ingestion.senate_client import SenateClient
 from ingestion.sync_meta import get_last_sync, set_last_sync
 
@@ -45,6 +45,13 @@ _SENATE_ISSUE_TYPES = [
 _LEGISLATORS_PATH = Path(__file__).parent.parent / "db" / "legislators.csv"
 
 
+# Computed on every (re)load, so a replaced vote never keeps a stale flag
+_VOTE_COMPUTED = {
+    "updated_at": "CURRENT_TIMESTAMP",
+    "is_passage_vote": f"coalesce({PASSAGE_VOTE_SQL}, FALSE)",
+}
+
+
 def _build_house_bill_id(congress: int, leg_type: str, leg_num: str) -> str | None:
     """Build a bill_id from House vote legislation metadata."""
     if not leg_type or not leg_num:
@@ -147,55 +154,60 @@ def sync_votes(
         log.warning("No votes fetched")
         return
 
+    # Load in date order so the appended row groups stay clustered on
+    # vote_date and date-range scans can skip them via zone maps
+    votes.sort(key=lambda v: v.get("startDate") or "")
+
+    rows = []
+    for vote in track(votes, description="Loading votes..."):
+        roll_call = vote.get("rollCallNumber")
+        session = vote.get("sessionNumber", 1)
+
+        if not roll_call:
+            continue
+
+        vote_id = f"{congress}-house-{session}-{roll_call}"
+
+        start_date = vote.get("startDate", "")
+        vote_date = start_date.split("T")[0] if start_date else None
+
+        leg_type = vote.get("legislationType", "")
+        leg_num = vote.get("legislationNumber", "")
+        amendment_author = vote.get("amendmentAuthor", "")
+
+        if amendment_author:
+            question = amendment_author
+        elif leg_type and leg_num:
+            question = f"{leg_type} {leg_num}"
+        else:
+            question = vote.get("voteType", "")
+
+        bill_id = _build_house_bill_id(congress, leg_type, str(leg_num)) if leg_num else None
+
+        yea_count = vote.get("yeaCount") or vote.get("yeas")
+        nay_count = vote.get("nayCount") or vote.get("nays")
+        present_count = vote.get("presentCount")
+        not_voting = vote.get("notVotingCount")
+
+        rows.append([
+            vote_id, congress, "house", session, roll_call,
+            vote_date, question, vote.get("voteType"),
+            vote.get("result"), bill_id, yea_count, nay_count,
+            present_count, not_voting,
+        ])
+
     with get_conn() as conn:
-        inserted = 0
-        for vote in track(votes, description="Loading votes..."):
-            roll_call = vote.get("rollCallNumber")
-            session = vote.get("sessionNumber", 1)
-
-            if not roll_call:
-                continue
-
-            vote_id = f"{congress}-house-{session}-{roll_call}"
-
-            start_date = vote.get("startDate", "")
-            vote_date = start_date.split("T")[0] if start_date else None
-
-            leg_type = vote.get("legislationType", "")
-            leg_num = vote.get("legislationNumber", "")
-            amendment_author = vote.get("amendmentAuthor", "")
-
-            if amendment_author:
-                question = amendment_author
-            elif leg_type and leg_num:
-                question = f"{leg_type} {leg_num}"
-            else:
-                question = vote.get("voteType", "")
-
-            bill_id = _build_house_bill_id(congress, leg_type, str(leg_num)) if leg_num else None
-
-            yea_count = vote.get("yeaCount") or vote.get("yeas")
-            nay_count = vote.get("nayCount") or vote.get("nays")
-            present_count = vote.get("presentCount")
-            not_voting = vote.get("notVotingCount")
-
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO votes (
-                    vote_id, congress, chamber, session, roll_call,
-                    vote_date, question, description, result,
-                    bill_id, yea_count, nay_count, present_count, not_voting,
-                    updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                [
-                    vote_id, congress, "house", session, roll_call,
-                    vote_date, question, vote.get("voteType"),
-                    vote.get("result"), bill_id, yea_count, nay_count,
-                    present_count, not_voting,
-                ],
-            )
-            inserted += 1
+        inserted = bulk_insert(
+            conn,
+            "votes",
+            (
+                "vote_id", "congress", "chamber", "session", "roll_call",
+                "vote_date", "question", "description", "result",
+                "bill_id", "yea_count", "nay_count", "present_count", "not_voting",
+            ),
+            rows,
+            _VOTE_COMPUTED,
+        )
 
     log.info("Inserted %d votes", inserted)
     set_last_sync(f"votes-{congress}", inserted)
@@ -204,30 +216,50 @@ def sync_votes(
         sync_member_votes(congress, votes)
 
 
+_MEMBER_VOTE_COLUMNS = ("vote_id", "bioguide_id", "position")
+
+
 def sync_member_votes(congress: int, votes: list[dict] | None = None, limit: int = 100):
-    """Sync individual House member voting positions."""
-    with get_conn() as conn:
-        if votes is None:
-            query = "SELECT vote_id, session, roll_call FROM votes WHERE congress = ? AND chamber = 'house'"
-            if limit > 0:
-                query += f" LIMIT {limit}"
+    """Sync individual House member voting positions.
+
+    Positions are written every WRITE_CHUNK_SIZE votes under a short-lived
+    connection, so other ingest tasks can write while this one waits on the
+    API, and a failed run keeps what it already fetched.
+    """
+    if votes is None:
+        query = "SELECT vote_id, session, roll_call FROM votes WHERE congress = ? AND chamber = 'house'"
+        if limit > 0:
+            query += f" LIMIT {limit}"
+        with get_conn(read_only=True) as conn:
             db_votes = conn.execute(query, [congress]).fetchall()
-            votes = [{"_vote_id": v[0], "sessionNumber": v[1], "rollCallNumber": v[2]} for v in db_votes]
+        votes = [{"_vote_id": v[0], "sessionNumber": v[1], "rollCallNumber": v[2]} for v in db_votes]
 
-        if not votes:
-            log.warning("No votes found. Run 'sync votes' first.")
-            return
+    if not votes:
+        log.warning("No votes found. Run 'sync votes' first.")
+        return
+
+    if limit > 0 and len(votes) > limit:
+        votes = votes[:limit]
 
-        if limit > 0 and len(votes) > limit:
-            votes = votes[:limit]
+    log.info("Fetching House member positions for %d votes", len(votes))
 
-        log.info("Fetching House member positions for %d votes", len(votes))
+    rows: list[list] = []
+    inserted = 0
+    consecutive_errors = 0
 
-        inserted = 0
-        consecutive_errors = 0
+    def flush() -> None:
+        nonlocal inserted
+        if not rows:
+            return
+        with get_conn() as conn:
+            inserted += bulk_insert(conn, "member_votes", _MEMBER_VOTE_COLUMNS, rows)
+        rows.clear()
 
-        with CongressClient() as client:
-            for vote in track(votes, description="Fetching member votes..."):
+    with CongressClient() as client:
+        try:
+            for i, vote in enumerate(track(votes, description="Fetching member votes...")):
+                if i and i % WRITE_CHUNK_SIZE == 0:
+                    flush()
                 roll_call = vote.get("rollCallNumber")
                 session = vote.get("sessionNumber", 1)
 
@@ -248,15 +280,7 @@ def sync_member_votes(congress: int, votes: list[dict] | None = None, limit: int
                         if not bioguide_id or not position:
                             continue
 
-                        conn.execute(
-                            """
-                            INSERT OR REPLACE INTO member_votes (
-                                vote_id, bioguide_id, position
-                            ) VALUES (?, ?, ?)
-                            """,
-                            [vote_id, bioguide_id, position],
-                        )
-                        inserted += 1
+                        rows.append([vote_id, bioguide_id, position])
 
                     consecutive_errors = 0
                 except Exception as e:
@@ -264,6 +288,8 @@ def sync_member_votes(congress: int, votes: list[dict] | None = None, limit: int
                     log.debug("  Vote %s: %s", roll_call, e)
                     check_consecutive_errors(consecutive_errors, e)
                     continue
+        finally:
+            flush()
 
     log.info("Inserted %d House member votes", inserted)
 
@@ -296,59 +322,60 @@ def sync_senate_votes(congress: int = 118, session: int = 1):
         "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
     }
 
+    rows = []
+    for vote_el in track(vote_elements, description="Loading Senate votes..."):
+        vote_number = vote_el.findtext("vote_number", "").strip()
+        if not vote_number:
+            continue
+
+        vote_id = f"{congress}-senate-{session}-{vote_number}"
+
+        vote_date_raw = vote_el.findtext("vote_date", "").strip()
+        vote_date = None
+        if vote_date_raw:
+            parts = vote_date_raw.split("-")
+            if len(parts) == 2:
+                day = parts[0].zfill(2)
+                month = _month_map.get(parts[1])
+                if month:
+                    year = 2023 + (congress - 118) * 2 + (session - 1)
+                    vote_date = f"{year}-{month}-{day}"
+
+        issue = vote_el.findtext("issue", "").strip()
+        question = vote_el.findtext("question", "").strip()
+        result = vote_el.findtext("result", "").strip()
+        title = vote_el.findtext("title", "").strip()
+
+        tally = vote_el.find("vote_tally")
+        yea_count = None
+        nay_count = None
+        if tally is not None:
+            yea_text = tally.findtext("yeas", "").strip()
+            nay_text = tally.findtext("nays", "").strip()
+            yea_count = int(yea_text) if yea_text.isdigit() else None
+            nay_count = int(nay_text) if nay_text.isdigit() else None
+
+        bill_id = _parse_senate_issue(congress, issue)
+        description = title or issue or None
+
+        rows.append([
+            vote_id, congress, "senate", session, int(vote_number),
+            vote_date, question, description, result,
+            bill_id, yea_count, nay_count,
+        ])
+
     with get_conn() as conn:
-        inserted = 0
-        for vote_el in track(vote_elements, description="Loading Senate votes..."):
-            vote_number = vote_el.findtext("vote_number", "").strip()
-            if not vote_number:
-                continue
-
-            vote_id = f"{congress}-senate-{session}-{vote_number}"
-
-            vote_date_raw = vote_el.findtext("vote_date", "").strip()
-            vote_date = None
-            if vote_date_raw:
-                parts = vote_date_raw.split("-")
-                if len(parts) == 2:
-                    day = parts[0].zfill(2)
-                    month = _month_map.get(parts[1])
-                    if month:
-                        year = 2023 + (congress - 118) * 2 + (session - 1)
-                        vote_date = f"{year}-{month}-{day}"
-
-            issue = vote_el.findtext("issue", "").strip()
-            question = vote_el.findtext("question", "").strip()
-            result = vote_el.findtext("result", "").strip()
-            title = vote_el.findtext("title", "").strip()
-
-            tally = vote_el.find("vote_tally")
-            yea_count = None
-            nay_count = None
-            if tally is not None:
-                yea_text = tally.findtext("yeas", "").strip()
-                nay_text = tally.findtext("nays", "").strip()
-                yea_count = int(yea_text) if yea_text.isdigit() else None
-                nay_count = int(nay_text) if nay_text.isdigit() else None
-
-            bill_id = _parse_senate_issue(congress, issue)
-            description = title or issue or None
-
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO votes (
-                    vote_id, congress, chamber, session, roll_call,
-                    vote_date, question, description, result,
-                    bill_id, yea_count, nay_count,
-                    updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                [
-                    vote_id, congress, "senate", session, int(vote_number),
-                    vote_date, question, description, result,
-                    bill_id, yea_count, nay_count,
-                ],
-            )
-            inserted += 1
+        inserted = bulk_insert(
+            conn,
+            "votes",
+            (
+                "vote_id", "congress", "chamber", "session", "roll_call",
+                "vote_date", "question", "description", "result",
+                "bill_id", "yea_count", "nay_count",
+            ),
+            rows,
+            _VOTE_COMPUTED,
+        )
 
     log.info("Inserted %d Senate votes", inserted)
 
@@ -362,23 +389,39 @@ def sync_senate_member_votes(congress: int = 118, session: int = 1):
 
     log.info("Loaded %d lis_id → bioguide_id mappings", len(lis_to_bioguide))
 
-    with get_conn() as conn:
+    with get_conn(read_only=True) as conn:
         db_votes = conn.execute(
             "SELECT vote_id, roll_call FROM votes WHERE congress = ? AND chamber = 'senate' AND session = ?",
             [congress, session],
         ).fetchall()
 
-        if not db_votes:
-            log.warning("No Senate votes found. Run 'sync senate-votes' first.")
-            return
+    if not db_votes:
+        log.warning("No Senate votes found. Run 'sync senate-votes' first.")
+        return
 
-        log.info("Fetching Senate member positions for %d votes", len(db_votes))
+    log.info("Fetching Senate member positions for %d votes", len(db_votes))
 
-        inserted = 0
-        unmatched_lis: set[str] = set()
+    rows: list[list] = []
+    inserted = 0
+    unmatched_lis: set[str] = set()
 
-        with SenateClient() as client:
-            for vote_id, roll_call in track(db_votes, description="Fetching Senate member votes..."):
+    def flush() -> None:
+        nonlocal inserted
+        if not rows:
+            return
+        with get_conn() as conn:
+            inserted += bulk_insert(conn, "member_votes", _MEMBER_VOTE_COLUMNS, rows)
+        rows.clear()
+
+    # Written in chunks under short connections, so this can run alongside
+    # the Congress.gov detail syncs
+    with SenateClient() as client:
+        try:
+            for i, (vote_id, roll_call) in enumerate(
+                track(db_votes, description="Fetching Senate member votes...")
+            ):
+                if i and i % WRITE_CHUNK_SIZE == 0:
+                    flush()
                 detail = client.get_vote_detail(congress, session, roll_call)
                 if detail is None:
                     continue
@@ -401,15 +444,9 @@ def sync_senate_member_votes(congress: int = 118, session: int = 1):
                         "Not Voting": "Not Voting", "Present": "Present",
                     }.get(vote_cast, vote_cast)
 
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO member_votes (
-                            vote_id, bioguide_id, position
-                        ) VALUES (?, ?, ?)
-                        """,
-                        [vote_id, bioguide_id, position],
-                    )
-                    inserted += 1
+                    rows.append([vote_id, bioguide_id, position])
+        finally:
+            flush()
 
     if unmatched_lis:
         log.debug("  %d unmatched lis_ids (missing from legislators.csv)", len(unmatched_lis))
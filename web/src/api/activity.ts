@@ -1,5 +1,5 @@
 import { fetchApi } from './client'
-import type { ActivityFeed, TrendingSubject } from './types'
+import type { ActivityCount, ActivityFeed, ActivityItemLite, TrendingSubject } from './types'
 
 export type RecentActivityParams = {
   subject?: string
@@ -8,6 +8,7 @@ export type RecentActivityParams = {
   zip_code?: string
   chamber?: string
   days?: number
+  before?: string
   limit?: number
   offset?: number
 }
@@ -16,6 +17,16 @@ export function getRecentActivity(params?: RecentActivityParams) {
   return fetchApi<ActivityFeed>('/activity/recent', { params })
 }
 
+export function getRecentActivityIds(params?: RecentActivityParams) {
+  return fetchApi<Omit<ActivityFeed, 'items'> & { items: ActivityItemLite[] }>('/activity/recent', {
+    params: { ...params, projection: 'ids' },
+  })
+}
+
+export function getActivityCount(params?: Omit<RecentActivityParams, 'limit' | 'offset'>) {
+  return fetchApi<ActivityCount>('/activity/count', { params })
+}
+
 export function getTrendingSubjects(params?: { days?: number; limit?: number }) {
   return fetchApi<TrendingSubject[]>('/activity/trending-subjects', { params })
 }
@@ -10,8 +10,10 @@ export type ListBillsParams = {
   policy_area?: string
   sponsor_id?: string
   chamber?: string
+  cursor?: string
   limit?: number
   offset?: number
+  include_total?: boolean
 }
 
 export function listBills(params?: ListBillsParams) {
@@ -34,6 +36,6 @@ export function getCategories() {
   return fetchApi<CategoryList>('/bills/categories')
 }
 
-export function getSubjects(params?: { q?: string; limit?: number; offset?: number }) {
+export function getSubjects(params?: { q?: string; limit?: number; offset?: number; include_total?: boolean }) {
   return fetchApi<SubjectList>('/bills/subjects', { params })
 }
@@ -1,7 +1,13 @@
 import { fetchApi } from './client'
 import type { CommitteeList, CommitteeDetail } from './types'
 
-export function listCommittees(params?: { q?: string; chamber?: string; limit?: number; offset?: number }) {
+export function listCommittees(params?: {
+  q?: string
+  chamber?: string
+  limit?: number
+  offset?: number
+  include_total?: boolean
+}) {
   return fetchApi<CommitteeList>('/committees', { params })
 }
 
@@ -11,11 +11,19 @@ export type ActivityItem = {
   result: string | null
 }
 
+export type ActivityItemLite = Pick<ActivityItem, 'event_type' | 'date' | 'bill_id' | 'vote_id'>
+
 export type ActivityFeed = {
   items: ActivityItem[]
-  total: number
+  total: number | null
   offset: number
   limit: number
+  has_more: boolean
+  next_cursor: string | null
+}
+
+export type ActivityCount = {
+  total: number
 }
 
 export type TrendingSubject = {
@@ -162,9 +170,10 @@ export type BillDetail = Bill & {
 
 export type BillList = {
   bills: Bill[]
-  total: number
+  total: number | null
   offset: number
   limit: number
+  next_cursor: string | null
 }
 
 export type BillAction = {
@@ -201,7 +210,7 @@ export type Subject = {
 
 export type SubjectList = {
   subjects: Subject[]
-  total: number
+  total: number | null
 }
 
 export type Category = {
@@ -232,9 +241,10 @@ export type Vote = {
 
 export type VoteList = {
   votes: Vote[]
-  total: number
+  total: number | null
   offset: number
   limit: number
+  has_more: boolean
 }
 
 export type MemberPosition = {
@@ -291,7 +301,7 @@ export type CommitteeDetail = Committee & {
 
 export type CommitteeList = {
   committees: Committee[]
-  total: number
+  total: number | null
   offset: number
   limit: number
 }
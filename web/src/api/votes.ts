@@ -9,6 +9,7 @@ export type ListVotesParams = {
   passage_only?: boolean
   limit?: number
   offset?: number
+  include_total?: boolean
 }
 
 export function listVotes(params?: ListVotesParams) {
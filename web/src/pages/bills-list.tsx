@@ -56,6 +56,7 @@ export function BillsListPage() {
     policy_area: policyArea || undefined,
     chamber: chamber || undefined,
     limit: 30,
+    include_total: true,
   })
 
   const { data: categoriesData } = useCategories()
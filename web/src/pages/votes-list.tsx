@@ -121,6 +121,7 @@ export function VotesListPage() {
     result: result || undefined,
     passage_only: passageOnly,
     limit: 30,
+    include_total: true,
   })
 
   const votes = data?.votes ?? []